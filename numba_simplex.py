@@ -0,0 +1,277 @@
+"""Simplex de tablero compilado con Numba para modelos pequeños.
+
+Para problemas diminutos el costo de preparar ``linprog`` (validaciones, conversión
+de matrices, llamada a HiGHS) supera al pivoteo en sí. Este módulo implementa un
+simplex de dos fases con la regla de Bland sobre un tablero denso de NumPy y lo
+compila con ``numba.njit(cache=True)``, de modo que cada llamada posterior se
+ejecuta como código nativo. Para modelos de dos variables con restricciones ``<=``
+también ofrece ``resolver_lp_2d``, que enumera los vértices del polígono factible.
+
+Numba es una dependencia opcional: si no está instalada, ``JIT_DISPONIBLE`` queda
+en ``False`` y ``solver.py`` sigue usando HiGHS para todos los tamaños.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    JIT_DISPONIBLE = True
+except ImportError:  # pragma: no cover - degradado amable si numba no está instalado
+    JIT_DISPONIBLE = False
+
+    def njit(*args, **kwargs):
+        """Sustituto sin efecto de ``numba.njit`` que deja la función en Python puro."""
+
+        def decorador(funcion):
+            return funcion
+
+        return decorador
+
+
+# Mismos códigos que ``res.status`` de ``scipy.optimize.linprog``.
+ESTADO_OPTIMO = 0
+ESTADO_LIMITE_ITERACIONES = 1
+ESTADO_INFACTIBLE = 2
+ESTADO_NO_ACOTADO = 3
+
+
+@njit(cache=True)
+def _pivotear(tablero, fila, columna):
+    """Convierte ``tablero[fila, columna]`` en pivote y elimina la columna en el resto."""
+
+    tablero[fila, :] /= tablero[fila, columna]
+    for i in range(tablero.shape[0]):
+        if i != fila and tablero[i, columna] != 0.0:
+            tablero[i, :] -= tablero[i, columna] * tablero[fila, :]
+
+
+@njit(cache=True)
+def _ejecutar_fase(tablero, base, num_columnas, max_iter, tol):
+    """Itera el simplex (minimización) sobre las primeras ``num_columnas`` columnas.
+
+    La última fila del tablero guarda los costos reducidos y la última columna el
+    lado derecho. Se usa la regla de Bland para evitar ciclos.
+
+    Returns:
+        int: ``ESTADO_OPTIMO``, ``ESTADO_NO_ACOTADO`` o ``ESTADO_LIMITE_ITERACIONES``.
+    """
+
+    num_filas = tablero.shape[0] - 1
+    for _ in range(max_iter):
+        entrante = -1
+        for j in range(num_columnas):
+            if tablero[num_filas, j] < -tol:
+                entrante = j
+                break
+        if entrante == -1:
+            return ESTADO_OPTIMO
+
+        saliente = -1
+        mejor_razon = np.inf
+        for i in range(num_filas):
+            if tablero[i, entrante] > tol:
+                razon = tablero[i, -1] / tablero[i, entrante]
+                if razon < mejor_razon - tol or (
+                    razon <= mejor_razon + tol and saliente != -1 and base[i] < base[saliente]
+                ):
+                    mejor_razon = razon
+                    saliente = i
+        if saliente == -1:
+            return ESTADO_NO_ACOTADO
+
+        _pivotear(tablero, saliente, entrante)
+        base[saliente] = entrante
+
+    return ESTADO_LIMITE_ITERACIONES
+
+
+@njit(cache=True)
+def simplex_tablero(c, A_ub, b_ub, A_eq, b_eq, max_iter=10000, tol=1e-10):
+    """Maximiza ``c^T x`` sujeto a ``A_ub x <= b_ub``, ``A_eq x = b_eq`` y ``x >= 0``.
+
+    Args:
+        c (numpy.ndarray): Coeficientes de la función objetivo (``n``).
+        A_ub (numpy.ndarray): Matriz densa ``m_ub x n`` (puede tener cero filas).
+        b_ub (numpy.ndarray): Lados derechos de las filas ``<=``.
+        A_eq (numpy.ndarray): Matriz densa ``m_eq x n`` (puede tener cero filas).
+        b_eq (numpy.ndarray): Lados derechos de las igualdades.
+        max_iter (int): Límite de pivoteos por fase.
+        tol (float): Tolerancia numérica para costos reducidos y pivotes.
+
+    Returns:
+        tuple[int, numpy.ndarray, float]: Estado (códigos de ``linprog``), vector
+        ``x`` y valor de la función objetivo.
+    """
+
+    n = c.shape[0]
+    m_ub = A_ub.shape[0]
+    m_eq = A_eq.shape[0]
+    m = m_ub + m_eq
+
+    # Una fila necesita variable artificial si es igualdad o si su RHS es negativo
+    # (al multiplicarla por -1 la holgura queda con coeficiente -1).
+    necesita_artificial = np.zeros(m, dtype=np.bool_)
+    for i in range(m_ub):
+        necesita_artificial[i] = b_ub[i] < 0
+    for i in range(m_eq):
+        necesita_artificial[m_ub + i] = True
+    num_artificiales = int(necesita_artificial.sum())
+
+    num_reales = n + m_ub
+    tablero = np.zeros((m + 1, num_reales + num_artificiales + 1))
+    base = np.empty(m, dtype=np.int64)
+
+    artificial = num_reales
+    for i in range(m):
+        if i < m_ub:
+            fila_A = A_ub[i]
+            rhs = b_ub[i]
+            tablero[i, n + i] = 1.0
+        else:
+            fila_A = A_eq[i - m_ub]
+            rhs = b_eq[i - m_ub]
+        tablero[i, :n] = fila_A
+        tablero[i, -1] = rhs
+        if rhs < 0:
+            tablero[i, :] *= -1.0
+        if necesita_artificial[i]:
+            tablero[i, artificial] = 1.0
+            base[i] = artificial
+            artificial += 1
+        else:
+            base[i] = n + i
+
+    # Fase I: minimizar la suma de artificiales partiendo de la base identidad.
+    if num_artificiales:
+        for i in range(m):
+            if necesita_artificial[i]:
+                tablero[m, :] -= tablero[i, :]
+        tablero[m, num_reales:num_reales + num_artificiales] = 0.0
+        estado = _ejecutar_fase(tablero, base, num_reales + num_artificiales, max_iter, tol)
+        if estado != ESTADO_OPTIMO:
+            return estado, np.zeros(n), 0.0
+        if -tablero[m, -1] > tol * max(1.0, np.abs(tablero[:m, -1]).max()):
+            return ESTADO_INFACTIBLE, np.zeros(n), 0.0
+
+        # Sacamos de la base las artificiales que hayan quedado en cero.
+        for i in range(m):
+            if base[i] >= num_reales:
+                for j in range(num_reales):
+                    if abs(tablero[i, j]) > tol:
+                        _pivotear(tablero, i, j)
+                        base[i] = j
+                        break
+
+    # Fase II: minimizar -c^T x ignorando las columnas artificiales.
+    tablero[m, :] = 0.0
+    tablero[m, :n] = -c
+    for i in range(m):
+        if base[i] < n:
+            tablero[m, :] += c[base[i]] * tablero[i, :]
+    estado = _ejecutar_fase(tablero, base, num_reales, max_iter, tol)
+
+    x = np.zeros(n)
+    for i in range(m):
+        if base[i] < n:
+            x[base[i]] = tablero[i, -1]
+    return estado, x, float(c @ x)
+
+
+@njit(cache=True)
+def resolver_lp_2d(c, A, b, tol=1e-9):
+    """Maximiza ``c^T x`` con dos variables, ``A x <= b`` y ``x >= 0`` enumerando vértices.
+
+    La región factible es un polígono: si el óptimo existe está en la intersección
+    de dos de sus rectas (incluidos los ejes). Se prueban todos los pares con la regla
+    de Cramer (``O(m^2)`` sistemas 2x2) y, si hay algún vértice factible, se revisa
+    si alguna dirección de recesión (a lo largo de una recta de borde) mejora el
+    objetivo indefinidamente.
+
+    Args:
+        c (numpy.ndarray): Coeficientes de la función objetivo (2).
+        A (numpy.ndarray): Matriz ``m x 2`` de restricciones ``<=``.
+        b (numpy.ndarray): Lados derechos (``m``).
+        tol (float): Tolerancia relativa para determinantes y factibilidad.
+
+    Returns:
+        tuple[int, numpy.ndarray, float]: Estado (códigos de ``linprog``), vector
+        ``x`` y valor de la función objetivo.
+    """
+
+    m = A.shape[0]
+    total = m + 2
+    filas = np.zeros((total, 2))
+    rhs = np.zeros(total)
+    filas[:m] = A
+    rhs[:m] = b
+    # No negatividad como filas adicionales: -x1 <= 0 y -x2 <= 0.
+    filas[m, 0] = -1.0
+    filas[m + 1, 1] = -1.0
+
+    normas = np.sqrt(filas[:, 0] ** 2 + filas[:, 1] ** 2)
+
+    hay_vertice = False
+    mejor = 0.0
+    x_mejor = np.zeros(2)
+    for i in range(total):
+        for j in range(i + 1, total):
+            # Determinante relativo a las normas: descarta rectas casi paralelas sin
+            # depender de la escala de los coeficientes.
+            det = filas[i, 0] * filas[j, 1] - filas[i, 1] * filas[j, 0]
+            if abs(det) <= tol * normas[i] * normas[j]:
+                continue
+            x0 = (rhs[i] * filas[j, 1] - filas[i, 1] * rhs[j]) / det
+            x1 = (filas[i, 0] * rhs[j] - rhs[i] * filas[j, 0]) / det
+            factible = True
+            for k in range(total):
+                # La holgura admitida escala con la magnitud de cada término de la fila:
+                # con filas casi paralelas ``a_k x`` puede ser mucho mayor que ``b_k``.
+                termino0 = filas[k, 0] * x0
+                termino1 = filas[k, 1] * x1
+                escala = 1.0 + abs(termino0) + abs(termino1) + abs(rhs[k])
+                if termino0 + termino1 > rhs[k] + tol * escala:
+                    factible = False
+                    break
+            if factible:
+                valor = c[0] * x0 + c[1] * x1
+                if not hay_vertice or valor > mejor:
+                    hay_vertice = True
+                    mejor = valor
+                    x_mejor[0] = max(x0, 0.0)
+                    x_mejor[1] = max(x1, 0.0)
+
+    if not hay_vertice:
+        return ESTADO_INFACTIBLE, np.zeros(2), 0.0
+
+    # Los rayos extremos del cono de recesión {d : filas d <= 0} siguen alguna recta de borde.
+    for i in range(total):
+        norma = normas[i]
+        if norma <= tol:
+            continue
+        for signo in (1.0, -1.0):
+            d0 = -filas[i, 1] * signo / norma
+            d1 = filas[i, 0] * signo / norma
+            if c[0] * d0 + c[1] * d1 <= tol:
+                continue
+            es_rayo = True
+            for k in range(total):
+                if filas[k, 0] * d0 + filas[k, 1] * d1 > tol:
+                    es_rayo = False
+                    break
+            if es_rayo:
+                return ESTADO_NO_ACOTADO, np.zeros(2), 0.0
+
+    return ESTADO_OPTIMO, x_mejor, mejor
+
+
+if JIT_DISPONIBLE:
+    # Calentamos la compilación con un modelo trivial para que la primera llamada
+    # del usuario no pague el costo del JIT (con ``cache=True`` se reutiliza en disco).
+    simplex_tablero(
+        np.ones(1),
+        np.ones((1, 1)),
+        np.ones(1),
+        np.zeros((0, 1)),
+        np.zeros(0),
+    )
+    resolver_lp_2d(np.ones(2), np.ones((1, 2)), np.ones(1))
@@ -16,18 +16,28 @@ se inician en optimización puedan seguir el flujo completo sin tener que deduci
 intenciones ocultas del código.
 """
 
-from pulp import LpMaximize, LpMinimize, LpProblem, LpVariable, LpStatus, value
-from scipy.optimize import linprog
+import threading
+import warnings
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
+
+# PuLP, SciPy y Numba se importan dentro de las funciones que los usan: juntos
+# cuestan casi un segundo y el asistente puede mostrarse (o cerrarse) sin ellos.
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.prompt import Prompt, IntPrompt
     from rich.table import Table
+    from rich.text import Text
 except ImportError:  # pragma: no cover - degradado amable si rich no está instalado
     Console = None
+    Group = None
     Prompt = None
     IntPrompt = None
     Table = None
+    Text = None
 
 
 console = Console() if Console else None
@@ -42,6 +52,122 @@ ALGORITMOS_DISPONIBLES = {
 }
 
 
+@lru_cache(maxsize=None)
+def _solver_pulp():
+    """Instancia única y silenciosa del solver de PuLP, creada en el primer uso.
+
+    Evita reconstruir el solver en cada ``prob.solve`` y que su log se mezcle con la
+    salida del asistente. Si ``highspy`` está instalado se usa HiGHS dentro del
+    proceso; si no, CBC (que se lanza como subproceso e intercambia el modelo
+    mediante archivos temporales): primero el instalado con ``pulp[cbc]`` y, como
+    último recurso, el que PuLP 3 trae incluido (``PULP_CBC_CMD``, obsoleto y
+    eliminado en PuLP 4.0; por eso ``requirements.txt`` fija ``pulp<4``).
+    """
+
+    from pulp import COIN_CMD, HiGHS
+
+    for solver in (HiGHS(msg=False), COIN_CMD(msg=False)):
+        if solver.available():
+            return solver
+
+    from pulp import PULP_CBC_CMD
+
+    # El aviso de obsolescencia no aporta nada al usuario: la versión ya está fijada.
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        return PULP_CBC_CMD(msg=False)
+
+
+@lru_cache(maxsize=None)
+def _simplex_compilado():
+    """Importa :mod:`numba_simplex` en el primer uso.
+
+    Returns:
+        module | None: El módulo si Numba está instalado, ``None`` en caso contrario.
+    """
+
+    import numba_simplex
+
+    return numba_simplex if numba_simplex.JIT_DISPONIBLE else None
+
+# Variables PuLP ya construidas (ver ``_variables_pulp``), separadas por hilo.
+_CACHE_VARIABLES_PULP = threading.local()
+
+# Último modelo PuLP armado por cada método (ver ``_modelo_pulp_en_cache``), por hilo.
+_CACHE_MODELOS_PULP = threading.local()
+
+# Códigos enteros para los signos de las restricciones.
+_SIGNO_MENOR_IGUAL, _SIGNO_MAYOR_IGUAL, _SIGNO_IGUAL = 0, 1, 2
+_CODIGOS_SIGNO = {'<=': _SIGNO_MENOR_IGUAL, '>=': _SIGNO_MAYOR_IGUAL, '=': _SIGNO_IGUAL}
+
+# Valores aceptados para signos y tipos de variable, construidos una sola vez.
+_SIGNOS_VALIDOS = frozenset(_CODIGOS_SIGNO)
+_TIPOS_VAR_VALIDOS = frozenset({'continua', 'entera'})
+
+# Menú de algoritmos y su correspondencia con las claves de ``ALGORITMOS_DISPONIBLES``;
+# se definen una sola vez y el menú se imprime en un único bloque.
+_OPCIONES_ALGORITMO = MappingProxyType({
+    '1': 'simplex',
+    '2': 'punto_interior',
+    '3': 'programacion_entera',
+    '4': 'algoritmo_dual',
+    '5': 'relajacion_lagrangiana',
+    '6': 'auto'
+})
+_MENU_ALGORITMOS = (
+    ("Seleccione el algoritmo que desea usar:", "bold cyan"),
+    ("1. Método Simplex", None),
+    ("2. Método de Pivoteo Interior (Método de Punto Interior)", None),
+    ("3. Método de Programación Entera (Branch and Bound)", None),
+    ("4. Método Dual", None),
+    ("5. Método de Relajación Lagrangiana", None),
+    ("6. Selección automática (si no sabes qué elegir)", None),
+)
+
+# Variables a partir de las cuales el resultado se imprime como texto plano: una
+# tabla de Rich con miles de filas tarda varias veces más en dibujarse.
+_LIMITE_FILAS_RESULTADO = 200
+
+# Celdas (variables x restricciones) a partir de las cuales el resumen de la CLI
+# muestra sólo las dimensiones del modelo en lugar de la tabla completa.
+_LIMITE_CELDAS_RESUMEN = 1000
+
+# Tamaño máximo (variables x restricciones) que se envía al simplex compilado con Numba.
+_LIMITE_SIMPLEX_JIT = 500
+
+# Máximo de filas para resolver por enumeración de vértices los modelos de dos
+# variables (se prueban ``O(m^2)`` pares de rectas).
+_LIMITE_FILAS_2D = 50
+
+# Fracción de coeficientes no nulos por debajo de la cual conviene enviar CSR a HiGHS.
+_DENSIDAD_MAXIMA_CSR = 0.3
+
+# Opciones por defecto para HiGHS (``linprog``/``milp``): el presolve reduce el
+# modelo antes de factorizar. Se declara explícitamente para que no dependa del
+# valor por defecto de cada versión de SciPy.
+_OPCIONES_HIGHS = {'presolve': True}
+
+# Traducción de ``res.status`` de ``linprog``/``milp`` a los mismos textos que usa PuLP.
+_ESTADOS_LINPROG = {
+    0: 'Optimal',
+    1: 'Not Solved',
+    2: 'Infeasible',
+    3: 'Unbounded',
+    4: 'Undefined',
+}
+
+# Estados (límite de iteraciones, dificultades numéricas) que ameritan reintentar
+# con otra variante de HiGHS en lugar de reportar el fallo de inmediato.
+_ESTADOS_LINPROG_REINTENTABLES = frozenset({1, 4})
+
+# Conjuntos de referencia para ``_clasificar_variables``.
+_SOLO_CONTINUAS = frozenset({'continua'})
+_SOLO_ENTERAS = frozenset({'entera'})
+
+# Métodos que delegan en HiGHS y, por lo tanto, aceptan ``opciones``.
+_METODOS_HIGHS = frozenset({'simplex', 'punto_interior', 'programacion_entera'})
+
+
 def _imprimir(texto, style=None):
     """Imprime texto en consola respetando el estilo configurado.
 
@@ -57,6 +183,28 @@ def _imprimir(texto, style=None):
         print(texto)
 
 
+def _imprimir_bloque(lineas, tabla=None, pie=()):
+    """Imprime varias líneas (y opcionalmente una tabla) con una sola escritura.
+
+    Cada llamada a ``Console.print`` vuelve a calcular estilos y diseño, así que
+    las pantallas completas se arman primero y se envían de una vez.
+
+    Args:
+        lineas (list[tuple[str, str | None]]): Pares ``(texto, estilo)``.
+        tabla (rich.table.Table | None): Tabla que se muestra después de las líneas.
+        pie (list[tuple[str, str | None]]): Líneas que se muestran después de la tabla.
+    """
+
+    if console:
+        partes = [Text("\n").join(Text(texto, style=style or "") for texto, style in bloque)
+                  for bloque in (lineas, pie) if bloque]
+        if tabla is not None:
+            partes.insert(1, tabla)
+        console.print(Group(*partes) if len(partes) > 1 else partes[0])
+    else:
+        print("\n".join(texto for texto, _ in (*lineas, *pie)))
+
+
 def _solicitar_texto(mensaje):
     """Solicita texto al usuario con un prompt consistente en toda la CLI.
 
@@ -99,27 +247,60 @@ def _solicitar_entero(mensaje, minimo=1):
 def _solicitar_lista_floats(mensaje):
     """Lee números separados por espacio y los convierte en flotantes.
 
+    La conversión la hace NumPy en un solo paso y produce directamente el vector
+    contiguo que consumen la validación y los solvers.
+
     Args:
         mensaje (str): Prompt para guiar al usuario.
 
     Returns:
-        list[float]: Lista no vacía con los valores ingresados.
+        numpy.ndarray: Vector ``float64`` no vacío con los valores ingresados.
     """
 
     while True:
         entrada = _solicitar_texto(mensaje)
         try:
-            valores = [float(num) for num in entrada.split()]
-            if not valores:
+            valores = np.array(entrada.split(), dtype=np.float64)
+            if not valores.size:
                 raise ValueError
             return valores
         except ValueError:
             _imprimir("Ingrese números válidos separados por espacio.", style="bold red")
 
 
+def _solicitar_opcion(mensaje, opciones_validas, mensaje_error, mensaje_reintento=None):
+    """Pide un valor de un conjunto cerrado y repite hasta que sea válido.
+
+    La entrada se normaliza (sin espacios y en minúsculas) en un único lugar para
+    todos los asistentes que leen signos o tipos.
+
+    Args:
+        mensaje (str): Prompt inicial.
+        opciones_validas (frozenset[str]): Valores aceptados.
+        mensaje_error (str): Aviso mostrado ante un valor inválido.
+        mensaje_reintento (str | None): Prompt para los reintentos (por defecto ``mensaje``).
+
+    Returns:
+        str: Opción válida ingresada por el usuario.
+    """
+
+    opcion = _solicitar_texto(mensaje).strip().lower()
+    while opcion not in opciones_validas:
+        _imprimir(mensaje_error, style="bold red")
+        opcion = _solicitar_texto(mensaje_reintento or mensaje).strip().lower()
+    return opcion
+
+
+# Nombres ``x1..xn`` ya generados, indexados por cantidad de variables.
+_NOMBRES_VARIABLES = {}
+
+
 def _formatear_variables(valores):
     """Genera un diccionario amigable ``{'x1': valor, ...}`` con los resultados.
 
+    Los nombres se construyen una sola vez por tamaño y se reutilizan en llamadas
+    posteriores; los arreglos de NumPy se convierten a flotantes de Python.
+
     Args:
         valores (Iterable[float]): Colección en el orden original del solver.
 
@@ -127,7 +308,15 @@ def _formatear_variables(valores):
         dict[str, float]: Mapeo nombre-valor listo para mostrar.
     """
 
-    return {f"x{i + 1}": valor for i, valor in enumerate(valores)}
+    if isinstance(valores, np.ndarray):
+        valores = valores.tolist()
+    else:
+        valores = list(valores)
+    num_vars = len(valores)
+    nombres = _NOMBRES_VARIABLES.get(num_vars)
+    if nombres is None:
+        nombres = _NOMBRES_VARIABLES.setdefault(num_vars, tuple(f"x{i + 1}" for i in range(num_vars)))
+    return dict(zip(nombres, valores))
 
 
 def _resultado_base(metodo, exito, estado, variables=None, valor_objetivo=None, mensaje=None):
@@ -158,8 +347,8 @@ def validar_entrada(coef_objetivo, restricciones, tipo_restricciones, valores_re
     """Aplica comprobaciones estructurales antes de llamar a cualquier solver.
 
     Args:
-        coef_objetivo (list[float]): Coeficientes de la función a maximizar.
-        restricciones (list[list[float]]): Matriz ``A`` del modelo.
+        coef_objetivo (list[float] | numpy.ndarray): Coeficientes de la función a maximizar.
+        restricciones (list[list[float]] | numpy.ndarray): Matriz ``A`` del modelo.
         tipo_restricciones (list[str]): Signos (``<=``, ``>=``, ``=``) por fila.
         valores_restricciones (list[float]): Lado derecho ``b`` asociado a cada fila.
 
@@ -169,23 +358,57 @@ def validar_entrada(coef_objetivo, restricciones, tipo_restricciones, valores_re
     """
 
     try:
-        if not isinstance(coef_objetivo, list) or not all(isinstance(i, (int, float)) for i in coef_objetivo):
+        # Una sola conversión a NumPy sustituye el ``isinstance`` por elemento: el
+        # ``dtype`` resultante indica si todos los coeficientes son numéricos.
+        c = np.asarray(coef_objetivo)
+        if not isinstance(coef_objetivo, (list, np.ndarray)) or c.ndim != 1 or c.dtype.kind not in 'biuf':
             raise ValueError("Los coeficientes de la función objetivo deben ser una lista de números.")
+        if not np.isfinite(c).all():
+            raise ValueError("Los coeficientes de la función objetivo deben ser finitos.")
 
-        if not isinstance(restricciones, list) or not all(isinstance(r, list) for r in restricciones):
+        if not isinstance(restricciones, (list, np.ndarray)):
             raise ValueError("Las restricciones deben ser una lista de listas.")
 
-        if not isinstance(tipo_restricciones, list) or not all(tr in ['<=', '>=', '='] for tr in tipo_restricciones):
+        try:
+            # Una sola pasada en C; los elementos no hashables (p. ej. listas) se rechazan.
+            signos_validos = _SIGNOS_VALIDOS.issuperset(tipo_restricciones)
+        except TypeError:
+            signos_validos = False
+        if not isinstance(tipo_restricciones, list) or not signos_validos:
             raise ValueError("Las restricciones deben tener tipos válidos: ['<=', '>=', '=']")
 
         if len(restricciones) != len(tipo_restricciones) or len(restricciones) != len(valores_restricciones):
             raise ValueError("Cada restricción debe tener un tipo y un valor del lado derecho asociados.")
 
-        num_vars = len(coef_objetivo)
-        if any(len(restriccion) != num_vars for restriccion in restricciones):
-            raise ValueError(
-                "Todas las restricciones deben tener el mismo número de coeficientes que la función objetivo."
-            )
+        num_vars = len(c)
+        if len(restricciones):
+            try:
+                A = np.asarray(restricciones, dtype=np.float64)
+            except (TypeError, ValueError):
+                # Sólo en el camino de error recorremos las filas para dar un mensaje preciso.
+                if all(isinstance(r, (list, np.ndarray)) for r in restricciones):
+                    if any(len(r) != num_vars for r in restricciones):
+                        raise ValueError(
+                            "Todas las restricciones deben tener el mismo número de coeficientes que la función objetivo."
+                        )
+                    raise ValueError("Los coeficientes de las restricciones deben ser números.")
+                raise ValueError("Las restricciones deben ser una lista de listas.")
+            if A.ndim != 2:
+                raise ValueError("Las restricciones deben ser una lista de listas.")
+            # La forma de la matriz sustituye el recorrido fila por fila de ``len``.
+            if A.shape != (len(tipo_restricciones), num_vars):
+                raise ValueError(
+                    "Todas las restricciones deben tener el mismo número de coeficientes que la función objetivo."
+                )
+            if not np.isfinite(A).all():
+                raise ValueError("Los coeficientes de las restricciones deben ser finitos.")
+
+            try:
+                b = np.asarray(valores_restricciones, dtype=np.float64)
+            except (TypeError, ValueError):
+                b = None
+            if b is None or b.ndim != 1 or not np.isfinite(b).all():
+                raise ValueError("Los valores del lado derecho deben ser números finitos.")
 
         return True, None
 
@@ -200,29 +423,24 @@ def seleccionar_algoritmo():
         str: Clave dentro de ``ALGORITMOS_DISPONIBLES`` que representa el método.
     """
 
-    opciones = {
-        '1': 'simplex',
-        '2': 'punto_interior',
-        '3': 'programacion_entera',
-        '4': 'algoritmo_dual',
-        '5': 'relajacion_lagrangiana',
-        '6': 'auto'
-    }
+    _imprimir_bloque(_MENU_ALGORITMOS)
+    opcion = _solicitar_opcion(
+        "Ingrese el número del algoritmo",
+        _OPCIONES_ALGORITMO,
+        "Opción inválida. Intente nuevamente."
+    )
+    return _OPCIONES_ALGORITMO[opcion]
 
-    _imprimir("Seleccione el algoritmo que desea usar:", style="bold cyan")
-    _imprimir("1. Método Simplex")
-    _imprimir("2. Método de Pivoteo Interior (Método de Punto Interior)")
-    _imprimir("3. Método de Programación Entera (Branch and Bound)")
-    _imprimir("4. Método Dual")
-    _imprimir("5. Método de Relajación Lagrangiana")
-    _imprimir("6. Selección automática (si no sabes qué elegir)")
 
-    opcion = _solicitar_texto("Ingrese el número del algoritmo")
-    while opcion not in opciones:
-        _imprimir("Opción inválida. Intente nuevamente.", style="bold red")
-        opcion = _solicitar_texto("Ingrese el número del algoritmo")
+def _num_coeficientes(datos):
+    """Cantidad de coeficientes capturados para la función objetivo.
+
+    ``coef_objetivo`` es ``None`` o un arreglo de NumPy, cuyo valor de verdad es
+    ambiguo; por eso el asistente pregunta por la longitud en lugar de usar ``bool``.
+    """
 
-    return opciones[opcion]
+    coef = datos.get('coef_objetivo')
+    return 0 if coef is None else len(coef)
 
 
 def mostrar_menu_principal(datos):
@@ -235,24 +453,27 @@ def mostrar_menu_principal(datos):
         str: Opción elegida por el usuario ("0".."4").
     """
 
+    num_coef = _num_coeficientes(datos)
     opciones = [
-        ("1", "Configurar función objetivo", bool(datos.get('coef_objetivo'))),
-        ("2", "Definir tipo de variables", len(datos.get('tipo_variables', [])) == len(datos.get('coef_objetivo') or [])),
-        ("3", "Añadir restricciones", bool(datos.get('restricciones'))),
+        ("1", "Configurar función objetivo", num_coef > 0),
+        ("2", "Definir tipo de variables", len(datos.get('tipo_variables', [])) == num_coef),
+        ("3", "Añadir restricciones", len(datos.get('restricciones', [])) > 0),
         ("4", "Mostrar resumen y continuar"),
         ("0", "Salir")
     ]
 
-    _imprimir("\n=== Asistente de configuración ===", style="bold green")
+    lineas = [("\n=== Asistente de configuración ===", "bold green")]
     for clave, etiqueta, *estado in opciones:
         completado = estado[0] if estado else False
         marca = "✅" if completado else "⬜"
         if clave in {"4", "0"}:
             marca = "➡" if clave == "4" else marca
-        _imprimir(f"{clave}. {etiqueta} {marca}")
+        lineas.append((f"{clave}. {etiqueta} {marca}", None))
+    _imprimir_bloque(lineas)
 
+    claves_validas = {op[0] for op in opciones}
     opcion = _solicitar_texto("Seleccione una opción del menú")
-    while opcion not in {op[0] for op in opciones}:
+    while opcion not in claves_validas:
         _imprimir("Opción inválida. Intente nuevamente.", style="bold red")
         opcion = _solicitar_texto("Seleccione una opción del menú")
     return opcion
@@ -262,7 +483,7 @@ def capturar_funcion_objetivo():
     """Pide al usuario los coeficientes de la función objetivo.
 
     Returns:
-        list[float]: Vector ``c`` que se maximizará.
+        numpy.ndarray: Vector ``c`` que se maximizará.
     """
 
     return _solicitar_lista_floats("Ingrese los coeficientes de la función objetivo (separados por espacio)")
@@ -278,14 +499,15 @@ def capturar_tipo_variables(num_variables):
         list[str]: Tipos en el mismo orden que ``coef_objetivo``.
     """
 
-    tipos = []
-    for idx in range(num_variables):
-        tipo = _solicitar_texto(f"Tipo de la variable x{idx + 1} (continua/entera)").strip().lower()
-        while tipo not in {'continua', 'entera'}:
-            _imprimir("Tipo inválido. Debe ser 'continua' o 'entera'.", style="bold red")
-            tipo = _solicitar_texto(f"Reingrese el tipo de x{idx + 1}").strip().lower()
-        tipos.append(tipo)
-    return tipos
+    return [
+        _solicitar_opcion(
+            f"Tipo de la variable x{idx + 1} (continua/entera)",
+            _TIPOS_VAR_VALIDOS,
+            "Tipo inválido. Debe ser 'continua' o 'entera'.",
+            f"Reingrese el tipo de x{idx + 1}",
+        )
+        for idx in range(num_variables)
+    ]
 
 
 def capturar_restricciones(num_variables):
@@ -295,32 +517,34 @@ def capturar_restricciones(num_variables):
         num_variables (int): Número de columnas esperadas en cada restricción.
 
     Returns:
-        tuple[list[list[float]], list[str], list[float]]: Matriz de coeficientes,
-        listado de signos y lados derechos respectivamente.
+        tuple[numpy.ndarray, list[str], numpy.ndarray]: Matriz ``m x n`` de
+        coeficientes, listado de signos y vector de lados derechos respectivamente.
     """
 
     num_restricciones = _solicitar_entero("¿Cuántas restricciones tiene el problema?", minimo=1)
-    restricciones, tipos, valores = [], [], []
+    # La matriz y los vectores se reservan con su tamaño final y se rellenan por fila,
+    # de modo que validación y solvers reciben directamente arreglos contiguos.
+    restricciones = np.empty((num_restricciones, num_variables), dtype=np.float64)
+    tipos = [None] * num_restricciones
+    valores = np.empty(num_restricciones, dtype=np.float64)
+    error_longitud = (
+        f"La restricción debe tener {num_variables} coeficientes para coincidir con la función objetivo."
+    )
 
     for i in range(num_restricciones):
         mensaje_coef = f"Coeficientes de la restricción {i + 1} (separados por espacio)"
         restriccion = _solicitar_lista_floats(mensaje_coef)
-        while len(restriccion) != num_variables:
-            _imprimir(
-                f"La restricción debe tener {num_variables} coeficientes para coincidir con la función objetivo.",
-                style="bold red"
-            )
+        while restriccion.size != num_variables:
+            _imprimir(error_longitud, style="bold red")
             restriccion = _solicitar_lista_floats(mensaje_coef)
-        restricciones.append(restriccion)
+        restricciones[i] = restriccion
 
-        tipo = _solicitar_texto(f"Tipo de restricción {i + 1} (<=, >=, =)").strip()
-        while tipo not in {'<=', '>=', '='}:
-            _imprimir("Tipo inválido de restricción. Debe ser <=, >= o =.", style="bold red")
-            tipo = _solicitar_texto(f"Tipo de restricción {i + 1} (<=, >=, =)").strip()
-        tipos.append(tipo)
-
-        valor = float(_solicitar_texto(f"Valor del lado derecho para la restricción {i + 1}"))
-        valores.append(valor)
+        tipos[i] = _solicitar_opcion(
+            f"Tipo de restricción {i + 1} (<=, >=, =)",
+            _SIGNOS_VALIDOS,
+            "Tipo inválido de restricción. Debe ser <=, >= o =.",
+        )
+        valores[i] = float(_solicitar_texto(f"Valor del lado derecho para la restricción {i + 1}"))
 
     return restricciones, tipos, valores
 
@@ -328,31 +552,69 @@ def capturar_restricciones(num_variables):
 def mostrar_resumen(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
     """Expone un resumen tabular y pregunta si se desea continuar.
 
+    Si el modelo supera ``_LIMITE_CELDAS_RESUMEN`` celdas se muestran sólo sus
+    dimensiones: dibujar una tabla de miles de celdas con Rich tarda más que
+    resolver el modelo y no cabe en pantalla.
+
     Returns:
         bool: ``True`` si el usuario confirmó, ``False`` para volver al menú.
     """
 
-    _imprimir("\nResumen del modelo ingresado", style="bold cyan")
+    # El título viaja en la misma escritura que el cuerpo del resumen.
+    titulo = ("\nResumen del modelo ingresado", "bold cyan")
     num_vars = len(coef_objetivo)
-    headers = [f"x{i + 1}" for i in range(num_vars)]
+
+    if num_vars * len(restricciones) > _LIMITE_CELDAS_RESUMEN:
+        conteo = {signo: 0 for signo in _CODIGOS_SIGNO}
+        for signo in tipo_restricciones:
+            conteo[signo] += 1
+        no_nulos = int(np.count_nonzero(np.asarray(restricciones, dtype=np.float64)))
+        _imprimir_bloque([
+            titulo,
+            (f"Modelo grande: {num_vars} variables y {len(restricciones)} restricciones.", "bold"),
+            (f"Restricciones por tipo: {conteo['<=']} (<=), {conteo['>=']} (>=), {conteo['=']} (=).", None),
+            (f"Coeficientes no nulos en la matriz: {no_nulos} de {num_vars * len(restricciones)}.", None),
+            ("Todas las variables tienen cota inferior 0 y se maximiza la función objetivo.", None),
+        ])
+        return _confirmar_resumen()
+
+    # ``tolist`` convierte los arreglos de NumPy a floats de Python en una sola
+    # pasada; formatear esos floats es más barato que formatear escalares de NumPy.
+    coeficientes = np.asarray(coef_objetivo, dtype=np.float64).tolist()
+    filas = np.asarray(restricciones, dtype=np.float64).reshape(len(restricciones), num_vars).tolist()
+    valores = np.asarray(valores_restricciones, dtype=np.float64).tolist()
 
     if Table:
         table = Table(show_lines=True)
         table.add_column("Expresión", justify="left", style="bold")
-        for header in headers:
-            table.add_column(header, justify="center")
+        for i in range(num_vars):
+            table.add_column(f"x{i + 1}", justify="center")
         table.add_column("Tipo")
         table.add_column("RHS")
 
-        table.add_row("Función objetivo", *[str(c) for c in coef_objetivo], "Max", "-")
-        for idx, (rest, signo, rhs) in enumerate(zip(restricciones, tipo_restricciones, valores_restricciones), start=1):
-            table.add_row(f"Restricción {idx}", *[str(c) for c in rest], signo, str(rhs))
-        console.print(table) if console else print(table)
+        table.add_row("Función objetivo", *map(str, coeficientes), "Max", "-")
+        for idx, (rest, signo, rhs) in enumerate(zip(filas, tipo_restricciones, valores), start=1):
+            table.add_row(f"Restricción {idx}", *map(str, rest), signo, str(rhs))
+        _imprimir_bloque([titulo], table)
     else:
-        _imprimir(f"Función objetivo: Max z = {' + '.join(f'{coef}*x{i + 1}' for i, coef in enumerate(coef_objetivo))}")
-        for idx, (rest, signo, rhs) in enumerate(zip(restricciones, tipo_restricciones, valores_restricciones), start=1):
+        lineas = [
+            titulo,
+            (f"Función objetivo: Max z = {' + '.join(f'{coef}*x{i + 1}' for i, coef in enumerate(coeficientes))}", None),
+        ]
+        for idx, (rest, signo, rhs) in enumerate(zip(filas, tipo_restricciones, valores), start=1):
             lhs = ' + '.join(f"{coef}*x{i + 1}" for i, coef in enumerate(rest))
-            _imprimir(f"Restricción {idx}: {lhs} {signo} {rhs}")
+            lineas.append((f"Restricción {idx}: {lhs} {signo} {rhs}", None))
+        _imprimir_bloque(lineas)
+
+    return _confirmar_resumen()
+
+
+def _confirmar_resumen():
+    """Pregunta si se desea continuar con el modelo mostrado.
+
+    Returns:
+        bool: ``True`` si el usuario confirmó, ``False`` para volver al menú.
+    """
 
     respuesta = _solicitar_texto("¿Desea continuar con estos datos? (s/n)").lower()
     while respuesta not in {'s', 'n'}:
@@ -360,6 +622,13 @@ def mostrar_resumen(coef_objetivo, restricciones, tipo_restricciones, valores_re
     return respuesta == 's'
 
 
+@lru_cache(maxsize=None)
+def _titulo_resultado(metodo):
+    """Encabezado ``Resultado (<algoritmo>)`` memorizado por clave de método."""
+
+    return f"\nResultado ({ALGORITMOS_DISPONIBLES.get(metodo, 'Algoritmo')})"
+
+
 def mostrar_resultado(resultado):
     """Imprime en consola el resumen del solver ejecutado y sus métricas.
 
@@ -367,22 +636,107 @@ def mostrar_resultado(resultado):
         resultado (dict): Salida generada por ``resolver_modelo``.
     """
 
+    mensaje = resultado.get('mensaje')
+    valor_objetivo = resultado.get('valor_objetivo')
+    variables = resultado.get('variables')
+
     estilo = "bold green" if resultado.get('exito') else "bold yellow"
-    _imprimir(f"\nResultado ({ALGORITMOS_DISPONIBLES.get(resultado.get('metodo'), 'Algoritmo')})", style=estilo)
-    _imprimir(f"Estado: {resultado.get('estado')}")
-    if resultado.get('mensaje'):
-        _imprimir(resultado['mensaje'])
+    lineas = [
+        (_titulo_resultado(resultado.get('metodo')), estilo),
+        (f"Estado: {resultado.get('estado')}", None),
+    ]
+    if mensaje:
+        lineas.append((mensaje, None))
+
+    tabla = None
+    if variables:
+        lineas.append(("Variables óptimas:", "bold"))
+        if console and len(variables) <= _LIMITE_FILAS_RESULTADO:
+            tabla = Table()
+            tabla.add_column("Variable", style="bold")
+            tabla.add_column("Valor", justify="right")
+            for nombre, valor in variables.items():
+                tabla.add_row(nombre, str(valor))
+        else:
+            # Un único texto con todas las variables: se escribe en una sola pasada.
+            lineas.append(("\n".join(f"  {nombre} = {valor}" for nombre, valor in variables.items()), None))
+
+    # Como en la salida original, el valor objetivo se muestra después de las variables.
+    pie = []
+    if valor_objetivo is not None:
+        pie.append((f"Valor de la función objetivo: {valor_objetivo}", None))
+
+    _imprimir_bloque(lineas, tabla, pie)
+
+
+def _codificar_signos(tipo_restricciones):
+    """Traduce los signos ``<=``/``>=``/``=`` a un arreglo de códigos enteros.
+
+    Comparar enteros dentro de máscaras de NumPy es más barato que comparar
+    cadenas fila por fila; la traducción se hace una sola vez por modelo. Si ya
+    se reciben los códigos (ver ``_arreglos_modelo``) se devuelven sin copiar.
+
+    Args:
+        tipo_restricciones (list[str] | numpy.ndarray): Signos asociados a cada
+            fila o sus códigos ``int8``.
+
+    Returns:
+        numpy.ndarray: Códigos ``int8`` (ver ``_CODIGOS_SIGNO``).
+    """
+
+    if isinstance(tipo_restricciones, np.ndarray) and tipo_restricciones.dtype == np.int8:
+        return tipo_restricciones
+    return np.fromiter(
+        (_CODIGOS_SIGNO[signo] for signo in tipo_restricciones), dtype=np.int8, count=len(tipo_restricciones)
+    )
+
+
+def _matrices_restricciones(restricciones, tipo_restricciones, valores_restricciones, num_vars):
+    """Separa las restricciones en bloques ``A_ub x <= b_ub`` y ``A_eq x = b_eq``.
+
+    Los bloques se entregan en formato CSR sólo si la matriz es dispersa (menos de
+    ``_DENSIDAD_MAXIMA_CSR`` de coeficientes no nulos); en modelos densos construir
+    la matriz dispersa cuesta más de lo que ahorra y HiGHS recibe el arreglo denso.
+
+    Args:
+        restricciones (list[list[float]]): Coeficientes de cada restricción.
+        tipo_restricciones (list[str]): Signos asociados a cada fila.
+        valores_restricciones (list[float]): Lados derechos ``b``.
+        num_vars (int): Número de columnas de la matriz.
+
+    Returns:
+        tuple: ``(A_ub, b_ub, A_eq, b_eq)`` con matrices (CSR o densas) y arreglos
+        con los lados derechos; ambos valen ``None`` si el bloque queda vacío.
+    """
+
+    from scipy.sparse import csr_matrix
 
-    if resultado.get('variables'):
-        _imprimir("Variables óptimas:", style="bold")
-        for nombre, valor in resultado['variables'].items():
-            _imprimir(f"  {nombre} = {valor}")
+    A = np.asarray(restricciones, dtype=np.float64).reshape(len(restricciones), num_vars)
+    b = np.asarray(valores_restricciones, dtype=np.float64)
+    codigos = _codificar_signos(tipo_restricciones)
+    formato = csr_matrix if np.count_nonzero(A) < _DENSIDAD_MAXIMA_CSR * A.size else np.asarray
 
-    if resultado.get('valor_objetivo') is not None:
-        _imprimir(f"Valor de la función objetivo: {resultado['valor_objetivo']}")
+    # SciPy espera el formato estándar Ax <= b: las filas '>=' cambian de signo.
+    desigualdades = codigos != _SIGNO_IGUAL
+    igualdades = ~desigualdades
 
-def resolver_con_punto_interior(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
-    """Resuelve el modelo con ``scipy.optimize.linprog`` usando método interior.
+    A_ub = b_ub = A_eq = b_eq = None
+    if desigualdades.any():
+        # La indexación booleana ya copia el bloque, así que se niega en sitio sólo
+        # sobre las filas '>=' sin multiplicar todo el bloque por un vector de factores.
+        mayor_igual = codigos[desigualdades] == _SIGNO_MAYOR_IGUAL
+        A_ub, b_ub = A[desigualdades], b[desigualdades]
+        np.negative(A_ub, out=A_ub, where=mayor_igual[:, np.newaxis])
+        np.negative(b_ub, out=b_ub, where=mayor_igual)
+        A_ub = formato(A_ub)
+    if igualdades.any():
+        A_eq = formato(A[igualdades])
+        b_eq = b[igualdades]
+    return A_ub, b_ub, A_eq, b_eq
+
+
+def _forma_estandar(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
+    """Traduce el modelo de maximización a la forma de minimización de ``linprog``.
 
     Args:
         coef_objetivo (list[float]): Coeficientes de la función objetivo.
@@ -391,101 +745,264 @@ def resolver_con_punto_interior(coef_objetivo, restricciones, tipo_restricciones
         valores_restricciones (list[float]): Lados derechos ``b``.
 
     Returns:
-        dict: Resultado normalizado vía :func:`_resultado_base`.
+        tuple: ``(c, A_ub, b_ub, A_eq, b_eq)`` con ``c`` ya negado; puede reutilizarse
+        en varias llamadas a ``_resolver_lp_scipy``.
+    """
+
+    c = -np.asarray(coef_objetivo, dtype=np.float64)
+    return (c, *_matrices_restricciones(restricciones, tipo_restricciones, valores_restricciones, c.size))
+
+
+def _resolver_lp_scipy(forma_estandar, method, opciones=None):
+    """Maximiza ``c^T x`` con ``scipy.optimize.linprog`` sobre HiGHS.
+
+    Args:
+        forma_estandar (tuple): Resultado de ``_forma_estandar``.
+        method (str): Variante de HiGHS (``highs``, ``highs-ds``, ``highs-ipm``).
+        opciones (dict | None): Opciones adicionales que se pasan a ``linprog``;
+            se combinan con ``_OPCIONES_HIGHS`` y tienen prioridad sobre ellas.
+
+    Returns:
+        scipy.optimize.OptimizeResult: Resultado crudo de ``linprog`` (minimización de ``-c``).
     """
 
-    c = [-coef for coef in coef_objetivo]
-    A_ub, b_ub, A_eq, b_eq = [], [], [], []
-
-    for restriccion, signo, valor in zip(restricciones, tipo_restricciones, valores_restricciones):
-        # SciPy espera el formato estándar Ax <= b; convertimos cada restricción.
-        if signo == '<=':
-            A_ub.append(restriccion)
-            b_ub.append(valor)
-        elif signo == '>=':
-            A_ub.append([-coef for coef in restriccion])
-            b_ub.append(-valor)
-        else:  # '='
-            A_eq.append(restriccion)
-            b_eq.append(valor)
-
-    # El asistente únicamente modela variables con cota inferior cero.
-    bounds = [(0, None) for _ in coef_objetivo]
-    res = linprog(
+    from scipy.optimize import linprog
+
+    c, A_ub, b_ub, A_eq, b_eq = forma_estandar
+
+    # El asistente únicamente modela variables con cota inferior cero; HiGHS
+    # aplica la misma cota a todas las columnas sin construir una lista por variable.
+    return linprog(
         c,
-        A_ub=A_ub if A_ub else None,
-        b_ub=b_ub if b_ub else None,
-        A_eq=A_eq if A_eq else None,
-        b_eq=b_eq if b_eq else None,
-        bounds=bounds,
-        method='interior-point'
+        A_ub=A_ub,
+        b_ub=b_ub,
+        A_eq=A_eq,
+        b_eq=b_eq,
+        bounds=(0, None),
+        method=method,
+        options={**_OPCIONES_HIGHS, **(opciones or {})}
     )
 
-    if res.success:
-        variables = _formatear_variables(res.x)
+
+def resolver_con_punto_interior(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones,
+                                opciones=None):
+    """Resuelve el modelo con el punto interior de HiGHS (``linprog(method='highs-ipm')``).
+
+    Args:
+        coef_objetivo (list[float]): Coeficientes de la función objetivo.
+        restricciones (list[list[float]]): Coeficientes de cada restricción.
+        tipo_restricciones (list[str]): Signos asociados a cada fila.
+        valores_restricciones (list[float]): Lados derechos ``b``.
+        opciones (dict | None): Opciones avanzadas de HiGHS para ``linprog``. Si se
+            indican, el modelo siempre se envía a HiGHS.
+
+    Returns:
+        dict: Resultado normalizado vía :func:`_resultado_base`.
+    """
+
+    compilado = None
+    if (opciones is None and len(coef_objetivo) == 2 and 0 < len(restricciones) <= _LIMITE_FILAS_2D
+            and not _codificar_signos(tipo_restricciones).any()):
+        compilado = _simplex_compilado()
+
+    if compilado is not None:
+        # Dos variables y sólo filas ``<=``: el óptimo es un vértice del polígono
+        # factible y enumerarlos (compilado con Numba) evita preparar ``linprog``.
+        codigo, x, valor_objetivo = compilado.resolver_lp_2d(
+            np.asarray(coef_objetivo, dtype=np.float64),
+            np.asarray(restricciones, dtype=np.float64).reshape(-1, 2),
+            np.asarray(valores_restricciones, dtype=np.float64)
+        )
+        mensaje = 'Solución encontrada enumerando los vértices de la región factible (modelo de dos variables).'
+    else:
+        # Las matrices se arman una sola vez y se reutilizan si hace falta reintentar.
+        forma_estandar = _forma_estandar(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones)
+        res = _resolver_lp_scipy(forma_estandar, 'highs-ipm', opciones)
+        if res.status in _ESTADOS_LINPROG_REINTENTABLES:
+            # El punto interior puede detenerse en modelos degenerados; HiGHS en modo
+            # automático (con crossover/simplex) suele resolverlos.
+            res = _resolver_lp_scipy(forma_estandar, 'highs', opciones)
+        codigo, x, valor_objetivo = res.status, res.x, (-res.fun if res.status == 0 else None)
+        mensaje = 'Solución encontrada con el método de punto interior.'
+
+    # HiGHS reporta ``status == 0`` únicamente cuando encontró el óptimo.
+    if codigo == 0:
         return _resultado_base(
             'punto_interior',
             True,
-            res.message or 'Optimal',
-            variables=variables,
-            valor_objetivo=-res.fun,
-            mensaje='Solución encontrada con el método de punto interior.'
+            'Optimal',
+            variables=_formatear_variables(x),
+            valor_objetivo=valor_objetivo,
+            mensaje=mensaje
         )
 
     return _resultado_base(
         'punto_interior',
         False,
-        res.message or 'Sin solución',
+        _ESTADOS_LINPROG.get(codigo, 'Sin solución'),
         mensaje='No se encontró una solución óptima con el método de punto interior.'
     )
 
-def _construir_restriccion_pulp(prob, expr, signo, rhs, nombre):
-    """Añade la restricción apropiada al modelo PuLP indicado.
 
-    Esta función evita repetir ``if`` en cada solver basado en PuLP y deja explícito
-    cómo se traducen los símbolos ``<=``/``>=``/``=`` a la API ``prob += ...``.
+def _variables_pulp(prefijo, cantidad, cota_inferior=0, categoria='Continuous'):
+    """Devuelve ``cantidad`` variables PuLP ``{prefijo}1..{prefijo}n`` reutilizables.
+
+    Crear ``LpVariable`` implica sanear nombres y registrar atributos, así que las
+    variables se guardan por ``(prefijo, cota, categoría)`` y sólo se construyen
+    las que falten cuando el modelo crece. La caché es por hilo para que sesiones
+    concurrentes (por ejemplo, en Streamlit) no compartan ``varValue``.
+
+    Args:
+        prefijo (str): Prefijo del nombre de cada variable.
+        cantidad (int): Número de variables requeridas.
+        cota_inferior (float | None): Cota inferior (``None`` para variables libres).
+        categoria (str): Categoría PuLP (``Continuous``/``Integer``).
+
+    Returns:
+        list[LpVariable]: Variables en orden ``1..cantidad``.
     """
 
-    if signo == '<=':
-        prob += expr <= rhs, nombre
-    elif signo == '>=':
-        prob += expr >= rhs, nombre
-    else:
-        prob += expr == rhs, nombre
+    from pulp import LpVariable
+
+    cache = getattr(_CACHE_VARIABLES_PULP, 'variables', None)
+    if cache is None:
+        cache = _CACHE_VARIABLES_PULP.variables = {}
+
+    clave = (prefijo, cota_inferior, categoria)
+    variables = cache.get(clave, ())
+    if len(variables) < cantidad:
+        variables += tuple(
+            LpVariable(f"{prefijo}{i + 1}", lowBound=cota_inferior, cat=categoria)
+            for i in range(len(variables), cantidad)
+        )
+        cache[clave] = variables
+    return list(variables[:cantidad])
+
+
+def _expresion_lineal(coeficientes, variables, omitir_ceros=True):
+    """Construye ``sum(coef * var)`` como un único ``LpAffineExpression``.
+
+    Sumar términos con ``sum`` crea una expresión temporal por cada suma (costo
+    cuadrático); aquí se pasa la lista de pares ``(variable, coeficiente)`` de una
+    sola vez y se omiten los coeficientes nulos. Las funciones objetivo usan
+    ``omitir_ceros=False`` para que todas las variables queden registradas en el
+    modelo y CBC les asigne valor aunque no aparezcan en ninguna restricción.
+    """
+
+    from pulp import LpAffineExpression
+
+    if not omitir_ceros:
+        return LpAffineExpression(list(zip(variables, coeficientes)))
+    if isinstance(coeficientes, np.ndarray):
+        # Con arreglos, NumPy localiza los no nulos sin recorrer cada coeficiente en Python.
+        indices = np.flatnonzero(coeficientes)
+        return LpAffineExpression(
+            [(variables[i], coef) for i, coef in zip(indices.tolist(), coeficientes[indices].tolist())]
+        )
+    return LpAffineExpression([(var, coef) for coef, var in zip(coeficientes, variables) if coef])
+
+
+def _clave_estructura(matriz, es_igualdad):
+    """Resume la estructura de un modelo (matriz y filas de igualdad) en una clave hashable."""
+
+    return matriz.shape, matriz.tobytes(), es_igualdad.tobytes()
+
+
+def _modelo_pulp_en_cache(metodo, clave):
+    """Recupera el último modelo PuLP de ``metodo`` si su estructura coincide con ``clave``.
+
+    Armar el ``LpProblem`` (expresiones y restricciones) domina el tiempo en modelos
+    pequeños. Cuando se vuelve a resolver la misma matriz con otros lados derechos u
+    otra función objetivo, basta con actualizar esos datos sobre el modelo guardado.
+    Sólo se conserva un modelo por método y por hilo.
 
+    Args:
+        metodo (str): Clave del método (``algoritmo_dual``/``relajacion_lagrangiana``).
+        clave (tuple): Estructura del modelo (ver ``_clave_estructura``).
+
+    Returns:
+        tuple | None: Lo guardado con ``_guardar_modelo_pulp`` o ``None`` si no coincide.
+    """
+
+    modelos = getattr(_CACHE_MODELOS_PULP, 'modelos', None)
+    if modelos is None:
+        modelos = _CACHE_MODELOS_PULP.modelos = {}
+    guardado = modelos.get(metodo)
+    if guardado is not None and guardado[0] == clave:
+        return guardado[1]
+    return None
+
+
+def _guardar_modelo_pulp(metodo, clave, *modelo):
+    """Guarda ``modelo`` como el último armado para ``metodo`` (reemplaza al anterior)."""
+
+    _CACHE_MODELOS_PULP.modelos[metodo] = (clave, modelo)
+
+
+def _resolver_problema_pulp(prob):
+    """Resuelve ``prob`` con el solver compartido y traduce su estado a texto.
+
+    Returns:
+        str: Estado de ``pulp.LpStatus`` (``"Optimal"``, ``"Infeasible"``, ...).
+    """
+
+    from pulp import LpStatus
+
+    prob.solve(_solver_pulp())
+    return LpStatus.get(prob.status, "Inconnu")
 
-def resolver_simplex(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones, max_iter=None):
-    """Resuelve un modelo de maximización continuo mediante PuLP Simplex.
+
+def resolver_simplex(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones, max_iter=None,
+                     opciones=None):
+    """Resuelve un modelo de maximización continuo con el simplex dual de HiGHS.
+
+    Se llama directamente a ``linprog(method='highs-ds')``: el modelo no pasa por
+    PuLP ni por archivos temporales y la solución devuelta es básica. Si Numba está
+    instalado y el modelo es diminuto (``n * m`` menor a ``_LIMITE_SIMPLEX_JIT``)
+    se usa el simplex de tablero compilado de :mod:`numba_simplex`, que evita el
+    costo fijo de preparar ``linprog``.
 
     Args:
         coef_objetivo (list[float]): Vector ``c``.
         restricciones (list[list[float]]): Matriz ``A``.
         tipo_restricciones (list[str]): Signos por fila.
         valores_restricciones (list[float]): Lado derecho ``b``.
-        max_iter (int | None): Parámetro reservado para futuros ajustes (no usado).
+        max_iter (int | None): Límite opcional de iteraciones del simplex.
+        opciones (dict | None): Opciones avanzadas de HiGHS para ``linprog``. Si se
+            indican, el modelo siempre se envía a HiGHS.
     """
 
-    prob = LpProblem("Metodo_Simplex", LpMaximize)
-    variables = [LpVariable(f"x{i+1}", lowBound=0, cat='Continuous') for i in range(len(coef_objetivo))]
-
-    # Maximiza z = c^T x.
-    prob += sum(coef * var for coef, var in zip(coef_objetivo, variables)), "Funcion_Objetivo"
-
-    for idx, (restriccion, signo, valor) in enumerate(zip(restricciones, tipo_restricciones, valores_restricciones), start=1):
-        expr = sum(coef * var for coef, var in zip(restriccion, variables))
-        _construir_restriccion_pulp(prob, expr, signo, valor, f"Restriccion_{idx}")
-
-    prob.solve()
+    num_vars = len(coef_objetivo)
+    compilado = None
+    if opciones is None and 0 < num_vars * max(len(restricciones), 1) < _LIMITE_SIMPLEX_JIT:
+        compilado = _simplex_compilado()
 
-    estado = LpStatus.get(prob.status, "Inconnu")
-    if estado == "Optimal":
-        valores = {var.name: var.varValue for var in variables}
+    if compilado is not None:
+        A, b, es_igualdad = _normalizar_restricciones_en_menor_igual(
+            restricciones, tipo_restricciones, valores_restricciones
+        )
+        A = A.reshape(-1, num_vars)
+        codigo, x, valor_objetivo = compilado.simplex_tablero(
+            np.asarray(coef_objetivo, dtype=np.float64),
+            A[~es_igualdad], b[~es_igualdad],
+            A[es_igualdad], b[es_igualdad],
+            max_iter=max_iter if max_iter is not None else 10000
+        )
+    else:
+        if max_iter is not None:
+            opciones = {'maxiter': max_iter, **(opciones or {})}
+        forma_estandar = _forma_estandar(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones)
+        res = _resolver_lp_scipy(forma_estandar, 'highs-ds', opciones)
+        codigo, x, valor_objetivo = res.status, res.x, (-res.fun if res.status == 0 else None)
+
+    estado = _ESTADOS_LINPROG.get(codigo, 'Undefined')
+    if codigo == 0:
         return _resultado_base(
             'simplex',
             True,
             estado,
-            variables=valores,
-            valor_objetivo=value(prob.objective),
+            variables=_formatear_variables(x),
+            valor_objetivo=valor_objetivo,
             mensaje='Solución encontrada con el método Simplex.'
         )
 
@@ -497,33 +1014,43 @@ def resolver_simplex(coef_objetivo, restricciones, tipo_restricciones, valores_r
     )
 
 
-def resolver_con_programacion_entera(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
-    """Resuelve el mismo modelo con variables enteras usando PuLP (Branch and Bound).
+def resolver_con_programacion_entera(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones,
+                                     opciones=None):
+    """Resuelve el mismo modelo con variables enteras usando ``scipy.optimize.milp``.
 
     Es ideal cuando el usuario marcó las variables como discretas y mantiene la
-    estructura de maximización original del asistente.
+    estructura de maximización original del asistente. ``milp`` delega en el
+    branch-and-cut de HiGHS, sin pasar por PuLP ni por archivos temporales;
+    ``opciones`` (por ejemplo ``time_limit`` o ``mip_rel_gap``) se le reenvía tal cual.
     """
 
-    prob = LpProblem("Optimizacion_Entera", LpMaximize)
-    variables = [LpVariable(f"x{i+1}", lowBound=0, cat='Integer') for i in range(len(coef_objetivo))]
-
-    prob += sum(coef * var for coef, var in zip(coef_objetivo, variables)), "Ganancia_Total"
+    from scipy.optimize import Bounds, LinearConstraint, milp
 
-    for idx, (restriccion, signo, valor) in enumerate(zip(restricciones, tipo_restricciones, valores_restricciones), start=1):
-        expr = sum(coef * var for coef, var in zip(restriccion, variables))
-        _construir_restriccion_pulp(prob, expr, signo, valor, f"Restriccion_{idx}")
-
-    prob.solve()
+    num_vars = len(coef_objetivo)
+    A_ub, b_ub, A_eq, b_eq = _matrices_restricciones(restricciones, tipo_restricciones, valores_restricciones, num_vars)
+
+    restricciones_milp = []
+    if A_ub is not None:
+        restricciones_milp.append(LinearConstraint(A_ub, -np.inf, b_ub))
+    if A_eq is not None:
+        restricciones_milp.append(LinearConstraint(A_eq, b_eq, b_eq))
+
+    res = milp(
+        c=-np.asarray(coef_objetivo, dtype=np.float64),
+        constraints=restricciones_milp,
+        integrality=np.ones(num_vars),
+        bounds=Bounds(0, np.inf),
+        options={**_OPCIONES_HIGHS, **(opciones or {})}
+    )
 
-    estado = LpStatus.get(prob.status, "Inconnu")
-    if estado == "Optimal":
-        valores = {var.name: var.varValue for var in variables}
+    estado = _ESTADOS_LINPROG.get(res.status, 'Undefined')
+    if res.status == 0:
         return _resultado_base(
             'programacion_entera',
             True,
             estado,
-            variables=valores,
-            valor_objetivo=value(prob.objective),
+            variables=_formatear_variables(res.x),
+            valor_objetivo=-res.fun,
             mensaje='Solución encontrada con programación entera.'
         )
 
@@ -536,28 +1063,44 @@ def resolver_con_programacion_entera(coef_objetivo, restricciones, tipo_restricc
 
 
 def _normalizar_restricciones_en_menor_igual(restricciones, tipo_restricciones, valores_restricciones):
-    """Convierte ``>=`` y ``=`` en restricciones equivalentes en formato ``<=``.
+    """Convierte las restricciones ``>=`` en su equivalente ``<=``.
 
-    Se usa tanto para construir el dual como para la relajación lagrangiana.
+    Se usa tanto para construir el dual como para la relajación lagrangiana. Las
+    igualdades se conservan tal cual (en lugar de desdoblarlas en dos filas ``<=``
+    linealmente dependientes) y se marcan para que cada solver las trate de forma
+    nativa. La conversión se hace con NumPy y respeta el orden original.
+
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Matriz normalizada,
+        lados derechos y una máscara booleana que indica qué filas son igualdades.
+        Se devuelven arreglos (sin copiar a listas) porque todos los consumidores
+        trabajan directamente con NumPy. Si no hay filas ``>=`` la matriz y el lado
+        derecho pueden ser los mismos objetos recibidos, por lo que el llamador no
+        debe modificarlos en sitio.
     """
 
-    restricciones_normalizadas = []
-    valores_normalizados = []
+    if not len(restricciones):
+        return np.empty((0, 0)), np.empty(0), np.zeros(0, dtype=bool)
+
+    codigos = _codificar_signos(tipo_restricciones)
+    mayor_igual = codigos == _SIGNO_MAYOR_IGUAL
+    es_igualdad = codigos == _SIGNO_IGUAL
+    if not mayor_igual.any():
+        # Modelo ya canónico: no hay signos que invertir, evitamos copiar la matriz.
+        return (
+            np.asarray(restricciones, dtype=np.float64),
+            np.asarray(valores_restricciones, dtype=np.float64),
+            es_igualdad,
+        )
 
-    for coefs, signo, rhs in zip(restricciones, tipo_restricciones, valores_restricciones):
-        if signo == '<=':
-            restricciones_normalizadas.append(list(coefs))
-            valores_normalizados.append(rhs)
-        elif signo == '>=':
-            restricciones_normalizadas.append([-coef for coef in coefs])
-            valores_normalizados.append(-rhs)
-        else:  # '=' se descompone en dos restricciones
-            restricciones_normalizadas.append(list(coefs))
-            valores_normalizados.append(rhs)
-            restricciones_normalizadas.append([-coef for coef in coefs])
-            valores_normalizados.append(-rhs)
+    restricciones_normalizadas = np.array(restricciones, dtype=np.float64)
+    valores_normalizados = np.array(valores_restricciones, dtype=np.float64)
 
-    return restricciones_normalizadas, valores_normalizados
+    # Sólo las filas ``>=`` cambian de signo: se niegan en sitio sobre la copia, sin
+    # construir un vector de factores ni multiplicar las filas que no cambian.
+    np.negative(restricciones_normalizadas, out=restricciones_normalizadas, where=mayor_igual[:, np.newaxis])
+    np.negative(valores_normalizados, out=valores_normalizados, where=mayor_igual)
+    return restricciones_normalizadas, valores_normalizados, es_igualdad
 
 
 def resolver_con_algoritmo_dual(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
@@ -565,13 +1108,20 @@ def resolver_con_algoritmo_dual(coef_objetivo, restricciones, tipo_restricciones
 
     La formulación dual sólo tiene sentido si existen restricciones; en caso
     contrario la función retorna un mensaje indicando la carencia de información.
+    La variable dual ``y_i`` corresponde a la restricción ``i``: es no negativa para
+    filas ``<=``/``>=`` y libre cuando la restricción original es una igualdad. Las
+    duales libres se modelan como ``y_i - y_neg_i`` con ambas partes no negativas:
+    CBC maneja mal las variables sin cota inferior y llega a reportar ``Optimal``
+    en duales no acotados.
     """
 
-    restricciones_canonicas, rhs_canonicos = _normalizar_restricciones_en_menor_igual(
+    from pulp import LpMinimize, LpProblem, value
+
+    restricciones_canonicas, rhs_canonicos, es_igualdad = _normalizar_restricciones_en_menor_igual(
         restricciones, tipo_restricciones, valores_restricciones
     )
 
-    if not restricciones_canonicas:
+    if not len(restricciones_canonicas):
         return _resultado_base(
             'algoritmo_dual',
             False,
@@ -579,19 +1129,42 @@ def resolver_con_algoritmo_dual(coef_objetivo, restricciones, tipo_restricciones
             mensaje='El método dual requiere al menos una restricción para construir el problema dual.'
         )
 
-    prob = LpProblem("Metodo_Dual", LpMinimize)
-    dual_vars = [LpVariable(f"y{i+1}", lowBound=0) for i in range(len(restricciones_canonicas))]
-
-    prob += sum(b * y for b, y in zip(rhs_canonicos, dual_vars)), "Funcion_Objetivo_Dual"
-
-    for idx_var in range(len(coef_objetivo)):
-        expr = sum(restriccion[idx_var] * dual_vars[idx] for idx, restriccion in enumerate(restricciones_canonicas))
-        prob += expr >= coef_objetivo[idx_var], f"cota_variable_{idx_var + 1}"
-
-    prob.solve()
-    estado = LpStatus.get(prob.status, "Inconnu")
+    # Cada igualdad aporta una segunda columna ``-y_neg_i`` (fila negada de A y de b).
+    num_filas = len(es_igualdad)
+    matriz_dual = np.vstack((restricciones_canonicas, -restricciones_canonicas[es_igualdad]))
+    rhs_dual = np.concatenate((rhs_canonicos, -rhs_canonicos[es_igualdad]))
+
+    # Cada restricción dual tiene como lado derecho un coeficiente de la función objetivo.
+    cotas = np.asarray(coef_objetivo, dtype=np.float64).tolist()
+    clave = _clave_estructura(restricciones_canonicas, es_igualdad)
+    en_cache = _modelo_pulp_en_cache('algoritmo_dual', clave)
+    if en_cache is not None:
+        prob, dual_vars, restricciones_duales = en_cache
+        for restriccion, cota in zip(restricciones_duales, cotas):
+            restriccion.changeRHS(cota)
+    else:
+        prob = LpProblem("Metodo_Dual", LpMinimize)
+        dual_vars = _variables_pulp("y", num_filas) + _variables_pulp("y_neg", int(es_igualdad.sum()))
+
+        # Cada restricción dual usa una columna de la matriz: se transpone una sola vez
+        # a memoria contigua antes del bucle.
+        columnas = np.ascontiguousarray(matriz_dual.T)
+        restricciones_duales = []
+        for idx_var, (columna, cota) in enumerate(zip(columnas, cotas)):
+            restriccion = _expresion_lineal(columna, dual_vars) >= cota
+            prob += restriccion, f"cota_variable_{idx_var + 1}"
+            restricciones_duales.append(restriccion)
+        _guardar_modelo_pulp('algoritmo_dual', clave, prob, dual_vars, restricciones_duales)
+
+    prob.setObjective(_expresion_lineal(rhs_dual.tolist(), dual_vars, omitir_ceros=False))
+
+    estado = _resolver_problema_pulp(prob)
     if estado == "Optimal":
-        valores_duales = {var.name: var.varValue for var in dual_vars}
+        # Se reportan sólo las ``y_i`` originales: en las igualdades, ``y_i - y_neg_i``.
+        valores = np.array([var.varValue or 0.0 for var in dual_vars])
+        duales = valores[:num_filas]
+        duales[es_igualdad] -= valores[num_filas:]
+        valores_duales = {var.name: valor for var, valor in zip(dual_vars, duales.tolist())}
         valor_objetivo = value(prob.objective)
         mensaje = (
             "El método dual se resolvió correctamente. Puedes interpretar estas variables como"
@@ -622,30 +1195,53 @@ def resolver_con_relajacion_lagrangiana(coef_objetivo, restricciones, tipo_restr
     y su valor final indica cuánta violación queda en la solución.
     """
 
-    restricciones_canonicas, rhs_canonicos = _normalizar_restricciones_en_menor_igual(
+    from pulp import LpAffineExpression, LpMaximize, LpProblem, LpVariable, value
+
+    restricciones_canonicas, rhs_canonicos, es_igualdad = _normalizar_restricciones_en_menor_igual(
         restricciones, tipo_restricciones, valores_restricciones
     )
 
-    prob = LpProblem("Relajacion_Lagrangiana", LpMaximize)
-    variables = [LpVariable(f"x{i+1}", lowBound=0, cat='Continuous') for i in range(len(coef_objetivo))]
-    slacks = [LpVariable(f"s_relaj_{i+1}", lowBound=0, cat='Continuous') for i in range(len(restricciones_canonicas))]
+    variables = _variables_pulp("x", len(coef_objetivo))
+    clave = _clave_estructura(restricciones_canonicas, es_igualdad)
+    en_cache = _modelo_pulp_en_cache('relajacion_lagrangiana', clave)
+    if en_cache is not None:
+        prob, holguras, restricciones_relajadas = en_cache
+        for restriccion, rhs in zip(restricciones_relajadas, rhs_canonicos.tolist()):
+            restriccion.changeRHS(rhs)
+    else:
+        prob = LpProblem("Relajacion_Lagrangiana", LpMaximize)
+        slacks = _variables_pulp("s_relaj_", len(restricciones_canonicas))
+        # Las igualdades pueden violarse en ambos sentidos: añadimos una holgura negativa.
+        slacks_negativas = {
+            idx: LpVariable(f"s_relaj_{idx + 1}_neg", lowBound=0, cat='Continuous')
+            for idx in np.flatnonzero(es_igualdad).tolist()
+        }
+        holguras = [*slacks, *slacks_negativas.values()]
+
+        restricciones_relajadas = []
+        filas = zip(restricciones_canonicas, rhs_canonicos.tolist(), es_igualdad.tolist())
+        for idx, (coefs, rhs, igualdad) in enumerate(filas):
+            expr = _expresion_lineal(coefs, variables)
+            if igualdad:
+                restriccion = expr == rhs + slacks[idx] - slacks_negativas[idx]
+            else:
+                restriccion = expr <= rhs + slacks[idx]
+            prob += restriccion, f"Restriccion_relajada_{idx + 1}"
+            restricciones_relajadas.append(restriccion)
+        _guardar_modelo_pulp('relajacion_lagrangiana', clave, prob, holguras, restricciones_relajadas)
 
     # Penalizamos con suficiente peso las holguras para desalentar violaciones.
-    penalizacion = max(10.0, 10 * sum(abs(c) for c in coef_objetivo) or 1.0)
-    prob += (
-        sum(coef * var for coef, var in zip(coef_objetivo, variables))
-        - penalizacion * sum(slacks)
-    ), "Funcion_Objetivo_Relajada"
-
-    for idx, (coefs, rhs) in enumerate(zip(restricciones_canonicas, rhs_canonicos)):
-        expr = sum(coef * var for coef, var in zip(coefs, variables))
-        prob += expr <= rhs + slacks[idx], f"Restriccion_relajada_{idx + 1}"
-
-    prob.solve()
-    estado = LpStatus.get(prob.status, "Inconnu")
+    # El objetivo se arma en una sola pasada (sin expresiones intermedias por cada resta).
+    c = np.asarray(coef_objetivo, dtype=np.float64)
+    penalizacion = max(10.0, 10 * float(np.abs(c).sum()) or 1.0)
+    prob.setObjective(LpAffineExpression(
+        [*zip(variables, c.tolist()), *((holgura, -penalizacion) for holgura in holguras)]
+    ))
+
+    estado = _resolver_problema_pulp(prob)
     if estado == "Optimal":
         valores = {var.name: var.varValue for var in variables}
-        violaciones = {var.name: var.varValue for var in slacks}
+        violaciones = {var.name: var.varValue for var in holguras}
         violaciones_activas = {k: v for k, v in violaciones.items() if v and v > 1e-6}
         mensaje = "Resolución con relajación lagrangiana y penalización de violaciones."
         if violaciones_activas:
@@ -679,57 +1275,140 @@ def seleccionar_algoritmo_automaticamente(tipo_variables, restricciones):
         str: Clave del método recomendado.
     """
 
-    if todas_las_variables_son_continuas(tipo_variables):
+    clasificacion = _clasificar_variables(tipo_variables)
+    if clasificacion == 'continuas':
         return "simplex"
-    elif todas_las_variables_son_enteras(tipo_variables):
+    elif clasificacion == 'enteras':
         return "programacion_entera"
     elif problema_de_gran_escala(restricciones, len(tipo_variables)):
         return "relajacion_lagrangiana"
     else:
         return "algoritmo_dual"
 
-def todas_las_variables_son_continuas(tipo_variables):
-    """Comprueba si no hay variables enteras declaradas en el modelo.
+def _clasificar_variables(tipo_variables):
+    """Clasifica las declaraciones de variables con un único ``set`` de sus tipos.
+
+    Construir el conjunto recorre la lista en C; la clasificación se reduce después
+    a comparar conjuntos diminutos, sin generadores ni comparaciones por elemento.
 
     Args:
         tipo_variables (list[str]): Respuesta del usuario en el asistente.
 
     Returns:
-        bool: ``True`` si todas fueron marcadas como continuas.
+        str: ``'continuas'`` si todas son continuas (o no hay declaraciones),
+        ``'enteras'`` si todas son enteras y ``'mixtas'`` en cualquier otro caso.
     """
 
-    return all(tipo == 'continua' for tipo in tipo_variables)
+    tipos = set(tipo_variables)
+    if tipos <= _SOLO_CONTINUAS:
+        return 'continuas'
+    if tipos == _SOLO_ENTERAS:
+        return 'enteras'
+    return 'mixtas'
 
 
-def todas_las_variables_son_enteras(tipo_variables):
-    """Comprueba si todas las variables fueron declaradas como enteras.
+def problema_de_gran_escala(restricciones, num_variables):
+    """Define una heurística simple para detectar instancias medianas/grandes.
 
     Args:
-        tipo_variables (list[str]): Declaraciones ingresadas en el paso 2.
+        restricciones (list): Lista de restricciones capturadas.
+        num_variables (int): Número de variables declaradas.
 
     Returns:
-        bool: ``True`` únicamente si no hay variables continuas.
+        bool: ``True`` cuando hay más de cinco variables o restricciones.
     """
 
-    return all(tipo == 'entera' for tipo in tipo_variables)
+    return len(restricciones) > 5 or num_variables > 5
 
 
-def problema_de_gran_escala(restricciones, num_variables):
-    """Define una heurística simple para detectar instancias medianas/grandes.
+def _arreglos_modelo(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
+    """Convierte el modelo a arreglos de NumPy una sola vez por resolución.
 
-    Args:
-        restricciones (list): Lista de restricciones capturadas.
-        num_variables (int): Número de variables declaradas.
+    Los solvers vuelven a llamar a ``np.asarray`` sobre sus argumentos y a
+    ``_codificar_signos`` sobre los signos; al recibir arreglos ya convertidos esas
+    llamadas no copian, así que el modelo se traduce desde listas de Python una
+    única vez en lugar de una por cada paso (o por cada reintento).
 
     Returns:
-        bool: ``True`` cuando hay más de cinco variables o restricciones.
+        tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: ``c``
+        (``n``), ``A`` (``m x n``), códigos ``int8`` de los signos y ``b`` (``m``).
     """
 
-    return len(restricciones) > 5 or num_variables > 5
+    c = np.asarray(coef_objetivo, dtype=np.float64)
+    A = np.ascontiguousarray(restricciones, dtype=np.float64).reshape(len(restricciones), c.size)
+    codigos = _codificar_signos(tipo_restricciones)
+    b = np.asarray(valores_restricciones, dtype=np.float64)
+    return c, A, codigos, b
+
+
+def _resolver_caso_trivial(metodo, coef_objetivo, restricciones, tipo_restricciones, valores_restricciones):
+    """Resuelve sin invocar a ningún solver los modelos cuya respuesta es inmediata.
+
+    * Sin coeficientes en la función objetivo no hay modelo que resolver.
+    * Sin restricciones, el máximo es ``x = 0`` si ningún coeficiente es positivo y
+      el problema es no acotado en caso contrario.
+    * Con la función objetivo nula, ``x = 0`` es óptimo si satisface las restricciones.
+
+    Los dos últimos casos describen la solución primal, así que no se aplican al
+    método dual (que reporta las variables duales).
+
+    Returns:
+        dict | None: Resultado normalizado o ``None`` si hay que llamar al solver.
+    """
+
+    c = np.asarray(coef_objetivo, dtype=np.float64)
+    if not c.size:
+        return _resultado_base(
+            metodo,
+            False,
+            'Modelo vacío',
+            mensaje='La función objetivo no tiene coeficientes.'
+        )
+    if metodo == 'algoritmo_dual':
+        return None
+
+    if not len(restricciones):
+        if (c > 0).any():
+            return _resultado_base(
+                metodo,
+                False,
+                'Unbounded',
+                mensaje='Sin restricciones, la función objetivo crece sin límite.'
+            )
+    elif c.any():
+        return None
+    else:
+        # Con c = 0 cualquier punto factible es óptimo: basta comprobar el origen.
+        b = np.asarray(valores_restricciones, dtype=np.float64)
+        codigos = _codificar_signos(tipo_restricciones)
+        origen_factible = np.where(
+            codigos == _SIGNO_MENOR_IGUAL, b >= 0, np.where(codigos == _SIGNO_MAYOR_IGUAL, b <= 0, b == 0)
+        ).all()
+        if not origen_factible:
+            return None
+
+    return _resultado_base(
+        metodo,
+        True,
+        'Optimal',
+        variables=_formatear_variables(np.zeros(c.size)),
+        valor_objetivo=0.0,
+        mensaje='Solución trivial: el origen es óptimo, no fue necesario invocar al solver.'
+    )
+
+
+# Tabla de despacho inmutable; se arma una sola vez al importar el módulo.
+_DESPACHO_SOLVERS = MappingProxyType({
+    'simplex': resolver_simplex,
+    'punto_interior': resolver_con_punto_interior,
+    'programacion_entera': resolver_con_programacion_entera,
+    'algoritmo_dual': resolver_con_algoritmo_dual,
+    'relajacion_lagrangiana': resolver_con_relajacion_lagrangiana
+})
 
 
 def resolver_modelo(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones,
-                    tipo_variables=None, metodo='auto'):
+                    tipo_variables=None, metodo='auto', opciones=None):
     """Punto de entrada único para resolver desde cualquier interfaz.
 
     Args:
@@ -739,6 +1418,9 @@ def resolver_modelo(coef_objetivo, restricciones, tipo_restricciones, valores_re
         valores_restricciones (list[float]): Lados derechos ``b``.
         tipo_variables (list[str] | None): Declaración continua/entera opcional.
         metodo (str): Clave del algoritmo (``auto`` usa heurística).
+        opciones (dict | None): Opciones avanzadas de HiGHS para los métodos que lo
+            usan (``simplex``, ``punto_interior``, ``programacion_entera``); los
+            métodos basados en PuLP las ignoran.
 
     Returns:
         dict: Respuesta normalizada lista para CLI/Streamlit/tests.
@@ -748,15 +1430,7 @@ def resolver_modelo(coef_objetivo, restricciones, tipo_restricciones, valores_re
     if metodo in {None, 'auto'}:
         metodo = seleccionar_algoritmo_automaticamente(tipo_variables, restricciones)
 
-    dispatch = {
-        'simplex': resolver_simplex,
-        'punto_interior': resolver_con_punto_interior,
-        'programacion_entera': resolver_con_programacion_entera,
-        'algoritmo_dual': resolver_con_algoritmo_dual,
-        'relajacion_lagrangiana': resolver_con_relajacion_lagrangiana
-    }
-
-    solver = dispatch.get(metodo)
+    solver = _DESPACHO_SOLVERS.get(metodo)
     if not solver:
         return _resultado_base(
             metodo or 'desconocido',
@@ -765,11 +1439,26 @@ def resolver_modelo(coef_objetivo, restricciones, tipo_restricciones, valores_re
             mensaje='El algoritmo solicitado no está disponible.'
         )
 
-    resultado = solver(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones)
+    # Se valida antes de convertir a arreglos: una entrada irregular o no numérica
+    # debe terminar en un resultado fallido, no en una excepción de NumPy.
+    valido, error = validar_entrada(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones)
+    if not valido:
+        return _resultado_base(metodo, False, 'Entrada inválida', mensaje=error)
+
+    coef_objetivo, restricciones, tipo_restricciones, valores_restricciones = _arreglos_modelo(
+        coef_objetivo, restricciones, tipo_restricciones, valores_restricciones
+    )
+    trivial = _resolver_caso_trivial(metodo, coef_objetivo, restricciones, tipo_restricciones, valores_restricciones)
+    if trivial is not None:
+        return trivial
+
+    kwargs = {'opciones': opciones} if opciones and metodo in _METODOS_HIGHS else {}
+    resultado = solver(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones, **kwargs)
     if resultado.get('metodo') != metodo:
         resultado['metodo'] = metodo
     return resultado
 
+
 def datos_configurados(datos):
     """Ayuda a determinar si el asistente ya tiene la información mínima.
 
@@ -780,10 +1469,10 @@ def datos_configurados(datos):
         bool: ``True`` si todas las secciones obligatorias han sido completadas.
     """
 
-    coef = datos.get('coef_objetivo')
+    num_coef = _num_coeficientes(datos)
     tipos = datos.get('tipo_variables')
     restricciones = datos.get('restricciones')
-    return bool(coef) and len(tipos) == len(coef) and bool(restricciones)
+    return num_coef > 0 and len(tipos) == num_coef and len(restricciones) > 0
 
 
 def main():
@@ -811,15 +1500,15 @@ def main():
             datos['tipo_restricciones'] = []
             datos['valores_restricciones'] = []
         elif opcion_menu == '2':
-            if not datos.get('coef_objetivo'):
+            if not _num_coeficientes(datos):
                 _imprimir("Primero configure la función objetivo.", style="bold red")
                 continue
-            datos['tipo_variables'] = capturar_tipo_variables(len(datos['coef_objetivo']))
+            datos['tipo_variables'] = capturar_tipo_variables(datos['coef_objetivo'].size)
         elif opcion_menu == '3':
-            if not datos.get('coef_objetivo'):
+            if not _num_coeficientes(datos):
                 _imprimir("Configure la función objetivo antes de capturar las restricciones.", style="bold red")
                 continue
-            restricciones, tipos, valores = capturar_restricciones(len(datos['coef_objetivo']))
+            restricciones, tipos, valores = capturar_restricciones(datos['coef_objetivo'].size)
             datos['restricciones'] = restricciones
             datos['tipo_restricciones'] = tipos
             datos['valores_restricciones'] = valores
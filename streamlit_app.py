@@ -3,15 +3,20 @@
 El archivo actúa como una “capa de presentación” que hace lo siguiente:
 
 1. Configura una página ancha con estilos personalizados para los botones.
-2. Utiliza la barra lateral como asistente resumido (cantidad de variables,
-   restricciones y algoritmo deseado).
-3. Muestra un formulario con todos los coeficientes/tipos y, antes de resolver,
-   enseña un resumen tabular para que el estudiante verifique su modelo.
+2. Utiliza la barra lateral como asistente resumido (modo de entrada y
+   cantidad de variables y restricciones).
+3. Muestra un formulario con todos los coeficientes/tipos (o cuadros de texto
+   para pegar la matriz completa) y, antes de resolver, enseña un resumen
+   tabular para que el estudiante verifique su modelo.
 
 No contiene lógica matemática propia: cada validación y algoritmo se delega al
 módulo ``solver``, garantizando que CLI y web se comporten igual.
 """
 
+import io
+from types import MappingProxyType
+
+import numpy as np
 import pandas as pd
 import streamlit as st
 
@@ -22,6 +27,165 @@ from solver import (
     validar_entrada,
 )
 
+# Opciones fijas de los selectores, definidas una sola vez a nivel de módulo en lugar
+# de reconstruir listas y diccionarios dentro del formulario.
+_TIPOS_VARIABLE = ("continua", "entera")
+_TIPOS_RESTRICCION = ("<=", ">=", "=")
+
+# Etiqueta visible del selector de algoritmo -> clave que entiende ``resolver_modelo``.
+_OPCIONES_ALGORITMO = MappingProxyType({
+    "Selección automática": "auto",
+    "Método Simplex": "simplex",
+    "Método de Pivoteo Interior": "punto_interior",
+    "Programación Entera": "programacion_entera",
+    "Método Dual": "algoritmo_dual",
+    "Relajación Lagrangiana": "relajacion_lagrangiana",
+})
+_ETIQUETAS_ALGORITMO = tuple(_OPCIONES_ALGORITMO)
+
+
+@st.cache_data(max_entries=8)
+def _construir_resumen(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones, num_variables):
+    """Arma la expresión LaTeX del objetivo y la tabla de restricciones del resumen.
+
+    Streamlit vuelve a ejecutar el script en cada cambio de un widget; al recibir
+    tuplas (hashables) el resultado se memoriza y sólo se recalcula cuando el
+    modelo cambia de verdad.
+
+    Returns:
+        tuple[str | None, pandas.DataFrame | None]: LaTeX de la función objetivo y
+        tabla con coeficientes, tipo y lado derecho de cada restricción.
+    """
+
+    latex_objetivo = None
+    if coef_objetivo:
+        latex_objetivo = (
+            "z = "
+            + " + ".join(f"{coef} x_{{{i + 1}}}" for i, coef in enumerate(coef_objetivo))
+            + " \\rightarrow \\max"
+        )
+
+    df_resumen = None
+    if restricciones:
+        # Un único DataFrame a partir de la matriz en lugar de un diccionario por fila.
+        headers = [f"x{i + 1}" for i in range(num_variables)]
+        df_resumen = pd.DataFrame(list(restricciones), columns=headers).assign(
+            Tipo=list(tipo_restricciones), RHS=list(valores_restricciones)
+        )
+    return latex_objetivo, df_resumen
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _resolver_en_cache(coef_objetivo, restricciones, tipo_restricciones, valores_restricciones, tipo_variables,
+                       metodo):
+    """Llama a ``resolver_modelo`` y memoriza el resultado por modelo y método.
+
+    Volver a enviar el mismo modelo (o regresar a uno anterior) reutiliza la
+    solución en lugar de ejecutar otra vez el solver. Las tuplas de la clave se
+    devuelven a listas, que es lo que acepta ``validar_entrada``.
+
+    Returns:
+        dict: Resultado de ``resolver_modelo``.
+    """
+
+    return resolver_modelo(
+        list(coef_objetivo),
+        [list(fila) for fila in restricciones],
+        list(tipo_restricciones),
+        list(valores_restricciones),
+        tipo_variables=list(tipo_variables),
+        metodo=metodo,
+    )
+
+
+def _editor_persistente(clave, por_defecto, **opciones):
+    """Muestra un ``st.data_editor`` con clave fija que conserva lo ya capturado.
+
+    La tabla base se guarda en ``st.session_state``. Cuando cambian las dimensiones
+    (filas o columnas de ``por_defecto``) se reindexa la última tabla editada y sólo
+    las celdas nuevas toman los valores de ``por_defecto``; así, añadir una
+    restricción o una variable no borra los coeficientes ya escritos.
+
+    Args:
+        clave (str): Clave estable del editor en ``st.session_state``.
+        por_defecto (pandas.DataFrame): Tabla con el tamaño actual y los valores
+            iniciales de cada celda.
+        **opciones: Argumentos adicionales para ``st.data_editor``.
+
+    Returns:
+        pandas.DataFrame: Tabla editada por el usuario.
+    """
+
+    estado = st.session_state
+    clave_base, clave_editada = f"{clave}_base", f"{clave}_editada"
+    base = estado.get(clave_base)
+    if base is None or not (base.index.equals(por_defecto.index) and base.columns.equals(por_defecto.columns)):
+        previa = estado.get(clave_editada)
+        if previa is None:
+            base = por_defecto
+        else:
+            base = previa.reindex(index=por_defecto.index, columns=por_defecto.columns).fillna(por_defecto)
+        # Las ediciones pendientes se refieren a la tabla anterior y ya están
+        # incorporadas en la nueva base, así que se descartan.
+        if clave in estado:
+            del estado[clave]
+        estado[clave_base] = base
+
+    editada = st.data_editor(base, key=clave, **opciones)
+    estado[clave_editada] = editada
+    return editada
+
+
+def _leer_modelo_pegado(texto_objetivo, texto_matriz, texto_signos, texto_tipos):
+    """Interpreta el modelo escrito como texto en el modo "Pegar matriz".
+
+    Cada bloque se convierte con una sola llamada a ``np.loadtxt`` (código en C) en
+    lugar de crear un widget por coeficiente.
+
+    Args:
+        texto_objetivo (str): Coeficientes de la función objetivo separados por espacios.
+        texto_matriz (str): Una restricción por línea: coeficientes y, al final, el RHS.
+        texto_signos (str): Signos ``<=``/``>=``/``=`` separados por espacios.
+        texto_tipos (str): ``continua``/``entera`` por variable; vacío equivale a continuas.
+
+    Returns:
+        tuple: ``(coef_objetivo, restricciones, tipo_restricciones,
+        valores_restricciones, tipo_variables)`` listos para ``validar_entrada``.
+
+    Raises:
+        ValueError: Si algún bloque está vacío, no es numérico o tiene dimensiones
+            incompatibles (incluido un número de signos distinto al de restricciones).
+    """
+
+    if not texto_objetivo.strip() or not texto_matriz.strip():
+        raise ValueError("Escribe la función objetivo y al menos una restricción.")
+    try:
+        coef_objetivo = np.loadtxt(io.StringIO(texto_objetivo), ndmin=1)
+        matriz = np.loadtxt(io.StringIO(texto_matriz), ndmin=2)
+    except ValueError:
+        raise ValueError("La función objetivo y la matriz deben contener sólo números separados por espacios.")
+    if coef_objetivo.ndim != 1:
+        raise ValueError("La función objetivo debe escribirse en una sola línea.")
+
+    num_variables = coef_objetivo.size
+    if matriz.shape[1] != num_variables + 1:
+        raise ValueError(
+            f"Cada restricción debe tener {num_variables} coeficientes seguidos del lado derecho."
+        )
+
+    # El resumen se arma antes de validar el modelo: el número de signos debe
+    # coincidir con las filas para poder construir la tabla.
+    signos = texto_signos.split()
+    if len(signos) != matriz.shape[0]:
+        raise ValueError(f"Indica un signo (<=, >=, =) por cada una de las {matriz.shape[0]} restricciones.")
+
+    tipo_variables = texto_tipos.split() or ["continua"] * num_variables
+    if len(tipo_variables) != num_variables or not set(tipo_variables).issubset(_TIPOS_VARIABLE):
+        raise ValueError(f"Indica {num_variables} tipos de variable ('continua' o 'entera').")
+
+    return coef_objetivo, matriz[:, :-1], signos, matriz[:, -1], tipo_variables
+
+
 # ---------------------------------------------------------------------------
 # Configuración general de la página
 # ---------------------------------------------------------------------------
@@ -64,83 +228,92 @@ with st.sidebar:
     # Asistente rápido en la barra lateral
     # -----------------------------------------------------------------------
     st.header("Parámetros generales")
-    # Estos valores definen cuántos campos dinámicos aparecerán en el formulario.
-    num_variables = int(
-        st.number_input("Número de variables", min_value=1, max_value=10, value=2, step=1)
-    )
-    num_restricciones = int(
-        st.number_input("Número de restricciones", min_value=1, max_value=10, value=2, step=1)
-    )
-
-    opciones_algoritmo = {
-        "Selección automática": "auto",
-        "Método Simplex": "simplex",
-        "Método de Pivoteo Interior": "punto_interior",
-        "Programación Entera": "programacion_entera",
-        "Método Dual": "algoritmo_dual",
-        "Relajación Lagrangiana": "relajacion_lagrangiana",
-    }
-    algoritmo_label = st.selectbox("Algoritmo", list(opciones_algoritmo.keys()))
-    metodo_seleccionado = opciones_algoritmo[algoritmo_label]
+    modo_entrada = st.radio("Modo de entrada", ["Formulario", "Pegar matriz"], horizontal=True)
+    if modo_entrada == "Formulario":
+        # Estos valores definen cuántos campos dinámicos aparecerán en el formulario.
+        num_variables = int(
+            st.number_input("Número de variables", min_value=1, max_value=10, value=2, step=1)
+        )
+        num_restricciones = int(
+            st.number_input("Número de restricciones", min_value=1, max_value=10, value=2, step=1)
+        )
 
 with st.form("configuracion_modelo"):
     # -----------------------------------------------------------------------
-    # Formulario principal (función objetivo, tipos y restricciones)
+    # Formulario principal (función objetivo, tipos, restricciones y algoritmo)
     # -----------------------------------------------------------------------
     # Agrupamos la captura de datos para validar/enviar todo en un único submit.
-    st.subheader("Función objetivo ")
-    coef_objetivo = []
-    for i in range(num_variables):
-        coef = st.number_input(
-            f"Coeficiente de x{i + 1}",
-            key=f"coef_obj_{i}",
-            value=1.0 if i == 0 else 0.0,
-            format="%0.3f",
-        )
-        coef_objetivo.append(float(coef))
-
-    st.subheader("Tipo de variables")
-    tipo_variables = []
-    for i in range(num_variables):
-        tipo = st.selectbox(
-            f"Tipo de x{i + 1}",
-            options=["continua", "entera"],
-            index=0,
-            key=f"tipo_var_{i}",
-        )
-        tipo_variables.append(tipo)
-
-    st.subheader("Restricciones")
-    restricciones = []
-    tipo_restricciones = []
-    valores_restricciones = []
-    for r in range(num_restricciones):
-        st.markdown(f"**Restricción {r + 1}**")
-        coeficientes = []
-        for v in range(num_variables):
-            coef = st.number_input(
-                f"Coeficiente de x{v + 1} en R{r + 1}",
-                key=f"rest_{r}_{v}",
-                value=0.0,
-                format="%0.3f",
-            )
-            coeficientes.append(float(coef))
-        restricciones.append(coeficientes)
+    if modo_entrada == "Formulario":
+        # Cada bloque es un único ``st.data_editor``: la tabla completa viaja en un solo
+        # mensaje en lugar de un ``number_input`` por coeficiente.
+        nombres_variables = [f"x{i + 1}" for i in range(num_variables)]
 
-        tipo = st.selectbox(
-            f"Tipo de restricción {r + 1}",
-            options=["<=", ">=", "="],
-            key=f"tipo_rest_{r}",
+        st.subheader("Función objetivo y tipo de variables")
+        df_variables = _editor_persistente(
+            "editor_variables",
+            pd.DataFrame(
+                {
+                    "Coeficiente": [1.0] + [0.0] * (num_variables - 1),
+                    "Tipo": ["continua"] * num_variables,
+                },
+                index=nombres_variables,
+            ),
+            num_rows="fixed",
+            use_container_width=True,
+            column_config={
+                "Coeficiente": st.column_config.NumberColumn(format="%0.3f", required=True),
+                "Tipo": st.column_config.SelectboxColumn(options=_TIPOS_VARIABLE, required=True),
+            },
         )
-        tipo_restricciones.append(tipo)
+        coef_objetivo = df_variables["Coeficiente"].to_numpy(dtype=float)
+        tipo_variables = df_variables["Tipo"].tolist()
 
-        rhs = st.number_input(
-            f"Valor del lado derecho R{r + 1}",
-            key=f"rhs_{r}",
-            value=0.0,
-            format="%0.3f",
+        st.subheader("Restricciones")
+        df_restricciones = _editor_persistente(
+            "editor_restricciones",
+            pd.DataFrame(
+                0.0,
+                index=[f"R{r + 1}" for r in range(num_restricciones)],
+                columns=nombres_variables,
+            ).assign(Tipo="<=", RHS=0.0),
+            num_rows="fixed",
+            use_container_width=True,
+            column_config={
+                **{
+                    nombre: st.column_config.NumberColumn(format="%0.3f", required=True)
+                    for nombre in nombres_variables
+                },
+                "Tipo": st.column_config.SelectboxColumn(options=_TIPOS_RESTRICCION, required=True),
+                "RHS": st.column_config.NumberColumn(format="%0.3f", required=True),
+            },
+        )
+        # La matriz sale directamente como ``ndarray`` listo para los solvers.
+        restricciones = df_restricciones[nombres_variables].to_numpy(dtype=float)
+        tipo_restricciones = df_restricciones["Tipo"].tolist()
+        valores_restricciones = df_restricciones["RHS"].to_numpy(dtype=float)
+    else:
+        # Modo ligero: el modelo completo llega en cuatro cuadros de texto.
+        texto_objetivo = st.text_input(
+            "Función objetivo", value="1 0", help="Coeficientes separados por espacios."
+        )
+        texto_tipos = st.text_input(
+            "Tipo de variables",
+            value="",
+            help="'continua' o 'entera' por variable; déjalo vacío si todas son continuas.",
+        )
+        texto_matriz = st.text_area(
+            "Restricciones [A | b]",
+            value="1 1 4\n1 3 6",
+            help="Una restricción por línea: coeficientes y, al final, el lado derecho.",
+        )
+        texto_signos = st.text_input(
+            "Tipos de restricción", value="<= <=", help="Un signo (<=, >=, =) por restricción."
         )
-        valores_restricciones.append(float(rhs))
+
+    # El algoritmo sólo se lee al resolver: dentro del formulario cambiarlo no
+    # vuelve a ejecutar el script ni reconstruye las tablas de captura.
+    algoritmo_label = st.selectbox("Algoritmo", _ETIQUETAS_ALGORITMO)
+    metodo_seleccionado = _OPCIONES_ALGORITMO[algoritmo_label]
 
     submitted = st.form_submit_button(
         "Resolver modelo",
@@ -149,27 +322,39 @@ with st.form("configuracion_modelo"):
         type="primary",
     )
 
+if modo_entrada != "Formulario":
+    try:
+        (
+            coef_objetivo,
+            restricciones,
+            tipo_restricciones,
+            valores_restricciones,
+            tipo_variables,
+        ) = _leer_modelo_pegado(texto_objetivo, texto_matriz, texto_signos, texto_tipos)
+    except ValueError as error:
+        st.error(f"Error de validación: {error}")
+        st.stop()
+    num_variables = coef_objetivo.size
+
 st.subheader("Resumen del modelo")
 # Mostramos un resumen de todo lo capturado antes de resolver. Es equivalente
 # a la tabla que se enseña en la CLI con Rich, pero en versión tabular.
-if coef_objetivo:
+# Versión hashable del modelo: es la clave de las funciones memorizadas.
+modelo = (
+    tuple(coef_objetivo.tolist()),
+    tuple(map(tuple, restricciones.tolist())),
+    tuple(tipo_restricciones),
+    tuple(valores_restricciones.tolist()),
+)
+latex_objetivo, df_resumen = _construir_resumen(*modelo, num_variables)
+if latex_objetivo:
     st.write("Función objetivo: ")
-    st.latex(
-        "z = "
-        + " + ".join(f"{coef} x_{{{i + 1}}}" for i, coef in enumerate(coef_objetivo))
-        + " \\rightarrow \\max"
-    )
+    st.latex(latex_objetivo)
 
-if restricciones:
-    headers = [f"x{i + 1}" for i in range(num_variables)]
-    data = []
-    for coef, tipo, rhs in zip(restricciones, tipo_restricciones, valores_restricciones):
-        fila = {h: valor for h, valor in zip(headers, coef)}
-        fila["Tipo"] = tipo
-        fila["RHS"] = rhs
-        data.append(fila)
-    df_resumen = pd.DataFrame(data)
-    st.table(df_resumen)
+if df_resumen is not None:
+    # ``st.dataframe`` envía la tabla serializada en Arrow (columnas float64 sin
+    # conversión) en lugar de generar una tabla HTML estática en cada ejecución.
+    st.dataframe(df_resumen, hide_index=True, use_container_width=True)
 
 if submitted:
     # -----------------------------------------------------------------------
@@ -189,14 +374,7 @@ if submitted:
             st.info(
                 f"Selección automática: se ejecutará {ALGORITMOS_DISPONIBLES.get(metodo, metodo)}"
             )
-        resultado = resolver_modelo(
-            coef_objetivo,
-            restricciones,
-            tipo_restricciones,
-            valores_restricciones,
-            tipo_variables=tipo_variables,
-            metodo=metodo,
-        )
+        resultado = _resolver_en_cache(*modelo, tuple(tipo_variables), metodo)
 
         if resultado.get("exito"):
             st.success(
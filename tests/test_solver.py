@@ -0,0 +1,168 @@
+"""Pruebas de regresión para los solvers de ``solver.py``.
+
+Se ejecutan con ``python -m unittest discover tests`` (o con ``pytest``).
+"""
+
+import copy
+import json
+import os
+import pickle
+import sys
+import unittest
+
+import numpy as np
+from scipy.optimize import linprog
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numba_simplex  # noqa: E402
+from solver import resolver_con_algoritmo_dual, resolver_modelo  # noqa: E402
+
+
+class AlgoritmoDualTest(unittest.TestCase):
+
+    def test_dual_no_acotado_con_igualdades(self):
+        # El primal es infactible, así que el dual (con duales libres en las
+        # igualdades) es no acotado; CBC reportaba ``Optimal`` con 5.3125.
+        resultado = resolver_con_algoritmo_dual(
+            [5, 0],
+            [[-1, 4], [4, 2], [2, 5], [3, 0], [0, -1]],
+            ['<=', '=', '=', '=', '<='],
+            [15, 7, 9, 13, 11],
+        )
+
+        self.assertFalse(resultado['exito'])
+        self.assertEqual(resultado['estado'], 'Unbounded')
+
+    def test_dual_con_igualdad_reporta_dual_libre(self):
+        # max x1 + x2 s.a. x1 + x2 = 4, x1 <= 3: el óptimo vale 4 con y1 = 1, y2 = 0.
+        resultado = resolver_con_algoritmo_dual([1, 1], [[1, 1], [1, 0]], ['=', '<='], [4, 3])
+
+        self.assertTrue(resultado['exito'])
+        self.assertAlmostEqual(resultado['valor_objetivo'], 4.0)
+        self.assertEqual(list(resultado['variables']), ['y1', 'y2'])
+        self.assertAlmostEqual(resultado['variables']['y1'], 1.0)
+
+
+class ResultadoTest(unittest.TestCase):
+
+    def test_resultado_sin_solucion_es_serializable(self):
+        resultado = resolver_modelo([1, 1], [[1, 1]], ['>='], [1], metodo='simplex')
+
+        self.assertFalse(resultado['exito'])
+        self.assertEqual(resultado['variables'], {})
+        json.dumps(resultado)
+        pickle.dumps(resultado)
+        copy.deepcopy(resultado)
+
+    def test_entrada_irregular_devuelve_resultado(self):
+        resultado = resolver_modelo([1, 1], [[1, 1], [1]], ['<=', '<='], [4, 3], metodo='desconocido')
+        self.assertFalse(resultado['exito'])
+        self.assertEqual(resultado['estado'], 'Método no soportado')
+
+        resultado = resolver_modelo([1, 1], [[1, 'a'], [1]], ['<=', '<='], [4, 3], metodo='simplex')
+        self.assertFalse(resultado['exito'])
+        self.assertEqual(resultado['estado'], 'Entrada inválida')
+        self.assertEqual(resultado['variables'], {})
+
+
+class ResolverLp2dTest(unittest.TestCase):
+    """Compara la enumeración de vértices de ``numba_simplex`` con HiGHS."""
+
+    def _comparar_con_highs(self, c, A, b):
+        c, A, b = (np.asarray(v, dtype=np.float64) for v in (c, A, b))
+        estado, x, valor = numba_simplex.resolver_lp_2d(c, A, b)
+        referencia = linprog(-c, A_ub=A, b_ub=b, method='highs')
+
+        self.assertEqual(estado, referencia.status)
+        if estado == numba_simplex.ESTADO_OPTIMO:
+            self.assertAlmostEqual(valor, -referencia.fun, delta=1e-6 * max(1.0, abs(referencia.fun)))
+            self.assertAlmostEqual(float(c @ x), valor, delta=1e-6 * max(1.0, abs(valor)))
+        return estado
+
+    def test_filas_casi_paralelas(self):
+        # Con la tolerancia escalada sólo por |b_k| se descartaba el vértice óptimo.
+        estado = self._comparar_con_highs(
+            [94.61307956923454, -41.81399373410065],
+            [[234.0713291002302, -79.71152578138167],
+             [234.07135250736312, -79.71153375253425],
+             [0, -2.587184841719385e-4]],
+            [0.05344840589949605, -0.676124123966337, -90.63391631057601],
+        )
+        self.assertEqual(estado, numba_simplex.ESTADO_OPTIMO)
+
+    def test_infactible(self):
+        estado = self._comparar_con_highs([1, 1], [[1, 1], [-1, -1]], [2, -3])
+        self.assertEqual(estado, numba_simplex.ESTADO_INFACTIBLE)
+
+    def test_no_acotado(self):
+        estado = self._comparar_con_highs([1, 2], [[1, -1]], [4])
+        self.assertEqual(estado, numba_simplex.ESTADO_NO_ACOTADO)
+
+
+
+@unittest.skipUnless(numba_simplex.JIT_DISPONIBLE, "numba no está instalado")
+class SimplexTableroTest(unittest.TestCase):
+    """Compara el simplex de tablero compilado con ``linprog(method='highs')``."""
+
+    def _comparar_con_highs(self, c, A_ub=None, b_ub=None, A_eq=None, b_eq=None):
+        c = np.asarray(c, dtype=np.float64)
+        n = c.size
+        A_ub = np.asarray(A_ub if A_ub is not None else np.zeros((0, n)), dtype=np.float64)
+        b_ub = np.asarray(b_ub if b_ub is not None else np.zeros(0), dtype=np.float64)
+        A_eq = np.asarray(A_eq if A_eq is not None else np.zeros((0, n)), dtype=np.float64)
+        b_eq = np.asarray(b_eq if b_eq is not None else np.zeros(0), dtype=np.float64)
+
+        estado, x, valor = numba_simplex.simplex_tablero(c, A_ub, b_ub, A_eq, b_eq)
+        referencia = linprog(
+            -c,
+            A_ub=A_ub if len(b_ub) else None,
+            b_ub=b_ub if len(b_ub) else None,
+            A_eq=A_eq if len(b_eq) else None,
+            b_eq=b_eq if len(b_eq) else None,
+            method='highs',
+        )
+
+        self.assertEqual(estado, referencia.status)
+        if estado == numba_simplex.ESTADO_OPTIMO:
+            self.assertAlmostEqual(valor, -referencia.fun, places=7)
+            self.assertTrue(np.all(x >= -1e-9))
+            if len(b_ub):
+                self.assertTrue(np.all(A_ub @ x <= b_ub + 1e-7))
+            if len(b_eq):
+                np.testing.assert_allclose(A_eq @ x, b_eq, atol=1e-7)
+        return estado
+
+    def test_optimo(self):
+        estado = self._comparar_con_highs([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18])
+        self.assertEqual(estado, numba_simplex.ESTADO_OPTIMO)
+
+    def test_infactible_en_fase_uno(self):
+        estado = self._comparar_con_highs([1, 1], [[1, 1]], [2], [[1, 2]], [6])
+        self.assertEqual(estado, numba_simplex.ESTADO_INFACTIBLE)
+
+    def test_no_acotado(self):
+        estado = self._comparar_con_highs([1, 1], [[1, -1]], [3])
+        self.assertEqual(estado, numba_simplex.ESTADO_NO_ACOTADO)
+
+    def test_filas_de_igualdad(self):
+        estado = self._comparar_con_highs([2, 3, 1], [[1, 1, 1]], [10], [[1, -1, 0], [0, 1, 2]], [1, 6])
+        self.assertEqual(estado, numba_simplex.ESTADO_OPTIMO)
+
+    def test_lado_derecho_negativo(self):
+        # -x1 - x2 <= -2 equivale a x1 + x2 >= 2: el origen no es factible.
+        estado = self._comparar_con_highs([-1, -2], [[-1, -1], [1, 0]], [-2, 5])
+        self.assertEqual(estado, numba_simplex.ESTADO_OPTIMO)
+
+    def test_ejemplo_de_beale(self):
+        # Modelo degenerado con el que la regla de Dantzig cicla; Bland debe terminar.
+        estado = self._comparar_con_highs(
+            [0.75, -20, 0.5, -6],
+            [[0.25, -8, -1, 9], [0.5, -12, -0.5, 3], [0, 0, 1, 0]],
+            [0, 0, 1],
+        )
+        self.assertEqual(estado, numba_simplex.ESTADO_OPTIMO)
+
+
+if __name__ == '__main__':
+    unittest.main()